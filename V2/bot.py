@@ -4,7 +4,8 @@ from dotenv import load_dotenv
 import asyncio  # missing import
 import typing
 import requests
-from db_utils import *
+import pandas as pd
+from db_utils import create_connection, add_row, update_row
 
 load_dotenv('.secrets/.env') # load all the variables from the env file
 intents = discord.Intents.all()
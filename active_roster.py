@@ -0,0 +1,107 @@
+import os
+import time
+import asyncio
+from dataclasses import dataclass, field
+from dotenv import load_dotenv
+
+from utils import getAPI
+
+load_dotenv(".secrets/.env")
+
+#### ACTIVE ROSTER SNAPSHOT ####
+## The set of active players, refreshed in the background and shared by
+## every cog and view instead of each command fetching getAllPlayers and
+## each open view holding its own copy.
+ACTIVEPLAYERSAPIURL = "https://api.simulationsoccer.com/player/getAllPlayers"
+ROSTER_REFRESH_SECONDS = int(os.getenv("SSL_ROSTER_REFRESH", 900))
+ROSTER_RETRY_SECONDS = 60
+
+
+@dataclass(frozen = True)
+class RosterSnapshot:
+    pids: frozenset = frozenset()
+    pid_by_name: dict = field(default_factory = dict)
+    loaded_at: float = 0.0
+
+    def __len__(self):
+        return len(self.pids)
+
+    def is_active(self, pid):
+        return pid in self.pids
+
+
+def build_snapshot(players):
+    players = players.dropna(subset = ['pid'])
+    pids = [int(pid) for pid in players['pid'].tolist()]
+    pid_by_name = {}
+    for name, pid in zip(players['name'].tolist(), pids):
+        pid_by_name.setdefault(name, pid)
+    return RosterSnapshot(
+        pids = frozenset(pids),
+        pid_by_name = pid_by_name,
+        loaded_at = time.monotonic(),
+    )
+
+
+class ActiveRoster:
+    def __init__(self, refresh_seconds = ROSTER_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._snapshot = None
+        self._lock = asyncio.Lock()
+        self._task = None
+
+    @property
+    def snapshot(self):
+        """Last loaded snapshot, or None if none was loaded yet."""
+        return self._snapshot
+
+    async def refresh(self):
+        """Fetches the active players and swaps in a new snapshot."""
+        async with self._lock:
+            players = await getAPI(ACTIVEPLAYERSAPIURL, params = {"active": "true"})
+            if players is None or players.empty:
+                raise RuntimeError("no active players returned")
+            self._snapshot = build_snapshot(players)
+            return self._snapshot
+
+    async def get(self):
+        """Returns the current snapshot, loading it if there is none yet.
+
+        A stale snapshot is still returned if the refresh fails, and an
+        empty one if nothing could ever be loaded.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < self.refresh_seconds:
+            return snapshot
+        try:
+            return await self.refresh()
+        except Exception as e:
+            print("Active roster refresh failed:", e)
+            return self._snapshot or RosterSnapshot()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+                delay = self.refresh_seconds
+            except Exception as e:
+                print("Active roster refresh failed:", e)
+                delay = ROSTER_RETRY_SECONDS
+            await asyncio.sleep(delay)
+
+    def start(self):
+        """Starts the periodic background refresh."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+active_roster = ActiveRoster()
@@ -0,0 +1,134 @@
+import os
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+#### SSL API RESPONSE CACHE ####
+## In-process cache of decoded API responses keyed by URL + params, with a
+## time-to-live per endpoint and an LRU bound on the total body size.
+API_CACHE_MAX_BYTES = int(os.getenv("SSL_API_CACHE_BYTES", 64 * 1024 * 1024))
+
+
+class CachePolicy:
+    """How long responses from one endpoint stay fresh.
+
+    :param ttl: seconds a response is fresh, 0 disables caching
+    :param historical_ttl: seconds a response for a finished season is
+        fresh, None keeps it until it is evicted
+    """
+
+    def __init__(self, ttl, historical_ttl = 0):
+        self.ttl = ttl
+        self.historical_ttl = historical_ttl
+
+    def ttl_for(self, params, current_season = None):
+        if self.historical_ttl != 0 and is_historical(params, current_season):
+            return self.historical_ttl
+        return self.ttl
+
+
+NO_CACHE = CachePolicy(0)
+
+## Endpoints not listed here are never cached (bank, checklists, getPlayer...)
+ENDPOINT_POLICIES = {
+    "/index/schedule": CachePolicy(120, historical_ttl = None),
+    "/index/standings": CachePolicy(120, historical_ttl = None),
+    "/index/boxscore": CachePolicy(600, historical_ttl = None),
+    "/index/careerOutfield": CachePolicy(900),
+    "/index/careerKeeper": CachePolicy(900),
+    "/index/playerAggregate": CachePolicy(300),
+    "/player/getAllPlayers": CachePolicy(900),
+    "/player/getDraftClass": CachePolicy(600),
+    "/organization/getOrganizations": CachePolicy(3600),
+}
+
+
+def is_historical(params, current_season):
+    """True when the request targets a season that has already finished."""
+    if not params or current_season is None:
+        return False
+    try:
+        return int(params.get("season")) < int(current_season)
+    except (TypeError, ValueError):
+        return False
+
+
+def policy_for(endpoint):
+    return ENDPOINT_POLICIES.get(urlsplit(endpoint).path, NO_CACHE)
+
+
+def cache_key(endpoint, params = None):
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (endpoint, items)
+
+
+class ResponseCache:
+    def __init__(self, max_bytes = API_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Returns the cached value or None, counting the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, size, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, size, ttl):
+        """Stores a value for ttl seconds (None = until evicted).
+
+        :param size: size in bytes of the response body, used for the LRU bound
+        """
+        if ttl == 0 or size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (value, size, expires_at)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, endpoint = None):
+        """Drops every entry, or only the ones for the given endpoint."""
+        for key in list(self._entries):
+            if endpoint is None or key[0] == endpoint:
+                self._remove(key)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
@@ -0,0 +1,191 @@
+import os
+import asyncio
+import aiohttp
+from dotenv import load_dotenv
+
+from api_cache import ResponseCache, cache_key, policy_for
+from archive_store import is_archivable
+from json_decode import loads, decode, decode_frame
+
+load_dotenv(".secrets/.env")
+
+#### SHARED SSL API CLIENT ####
+## One pooled aiohttp session for the lifetime of the bot. Every cog goes
+## through this instead of opening its own connection per request.
+API_TIMEOUT = float(os.getenv("SSL_API_TIMEOUT", 15))
+API_CONNECT_TIMEOUT = float(os.getenv("SSL_API_CONNECT_TIMEOUT", 5))
+API_POOL_SIZE = int(os.getenv("SSL_API_POOL_SIZE", 100))
+API_PER_HOST_LIMIT = int(os.getenv("SSL_API_PER_HOST_LIMIT", 10))
+API_KEEPALIVE = float(os.getenv("SSL_API_KEEPALIVE", 30))
+
+
+def _has_content(data):
+    # DataFrames have no truth value, and a JSON null or number has no length
+    return hasattr(data, "__len__") and len(data) > 0
+
+
+class APIError(Exception):
+    """Raised when the SSL API answers with anything other than HTTP 200."""
+
+    def __init__(self, status, url):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class APIClient:
+    def __init__(
+        self,
+        timeout = API_TIMEOUT,
+        connect_timeout = API_CONNECT_TIMEOUT,
+        pool_size = API_POOL_SIZE,
+        per_host_limit = API_PER_HOST_LIMIT,
+        keepalive = API_KEEPALIVE,
+        cache = None,
+        archive = None,
+        current_season = None,
+    ):
+        self.timeout = aiohttp.ClientTimeout(total = timeout, connect = connect_timeout)
+        self.pool_size = pool_size
+        self.per_host_limit = per_host_limit
+        self.keepalive = keepalive
+        self.cache = cache if cache is not None else ResponseCache()
+        # Optional archive_store.ArchiveStore for finished seasons
+        self.archive = archive
+        # Callable returning the current season, used to tell finished
+        # seasons (cached until evicted) from the live one
+        self.current_season = current_season or (lambda: None)
+        self._session = None
+        # Fetches currently on the wire, keyed like the cache, so identical
+        # concurrent requests share one HTTP call (single-flight)
+        self._inflight = {}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        """Open the pooled session. Safe to call more than once."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit = self.pool_size,
+                limit_per_host = self.per_host_limit,
+                keepalive_timeout = self.keepalive,
+                ttl_dns_cache = 300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector = connector,
+                timeout = self.timeout,
+            )
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._session
+
+    async def get_json(self, endpoint, params = None):
+        """GET an endpoint and return the decoded JSON body.
+
+        Responses are served from the cache while fresh according to the
+        endpoint's policy in api_cache.ENDPOINT_POLICIES, then from the
+        on-disk archive for finished seasons, and only then fetched.
+        Concurrent calls for the same URL + params share a single fetch.
+
+        :param endpoint: full URL of the API endpoint
+        :param params: optional query parameters
+        :raises APIError: on a non-200 response
+        """
+        return await self._get(endpoint, params, cache_key(endpoint, params), loads)
+
+    async def get_frame(self, endpoint, params = None):
+        """GET an endpoint that returns a table and return it as a DataFrame.
+
+        Cached and archived like get_json, but the cache holds the built
+        DataFrame (a fraction of the size of the decoded records), so the
+        records are never kept. Callers must not modify the frame in place.
+
+        :raises APIError: on a non-200 response
+        :raises TypeError: if the body is not a JSON list or object
+        """
+        key = cache_key(endpoint, params) + ("frame",)
+        return await self._get(endpoint, params, key, decode_frame)
+
+    async def _get(self, endpoint, params, key, decoder):
+        ttl = policy_for(endpoint).ttl_for(params, self.current_season())
+        if ttl != 0:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, key, ttl, decoder))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+
+        # Shielded so one caller timing out does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _finish_flight(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved even if every waiter went away
+
+    async def _fetch(self, endpoint, params, key, ttl, decoder):
+        # The archive stores raw bodies under the plain URL + params key,
+        # whichever form the body is decoded into
+        archive_key = cache_key(endpoint, params)
+        archived = self.archive is not None and is_archivable(
+            endpoint, params, self.current_season()
+        )
+        if archived:
+            body = await self.archive.aget(archive_key)
+            if body is not None:
+                data = await decode(body, decoder)
+                self.cache.put(key, data, len(body), ttl)
+                return data
+
+        await self.start()
+        async with self._session.get(endpoint, params = params) as resp:
+            if resp.status != 200:
+                raise APIError(resp.status, resp.url)
+            body = await resp.read()
+
+        # Read in full, then decoded; large bodies on a worker thread, off
+        # the event loop (see json_decode)
+        data = await decode(body, decoder)
+        self.cache.put(key, data, len(body), ttl)
+        if archived and _has_content(data):
+            await self.archive.aput(archive_key, body)
+        return data
+
+    async def get_bytes(self, url, params = None):
+        """GET a URL and return the raw response body."""
+        await self.start()
+        async with self._session.get(url, params = params) as resp:
+            if resp.status != 200:
+                raise APIError(resp.status, resp.url)
+            return await resp.read()
+
+
+_client = None
+
+def set_client(client: APIClient):
+    """Registers the bot-owned client so module level helpers share it."""
+    global _client
+    _client = client
+
+def get_client() -> APIClient:
+    """Returns the shared client, creating an unmanaged one if none is set."""
+    global _client
+    if _client is None:
+        _client = APIClient()
+    return _client
@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import argparse
+import threading
+from urllib.parse import urlsplit
+
+from api_cache import is_historical
+
+#### PERSISTENT ARCHIVE OF FINISHED SEASONS ####
+## Schedules, standings and boxscores of completed seasons never change, so
+## their raw API responses are snapshotted to SQLite and read back before
+## going to the network, even right after a restart.
+ARCHIVE_DB_PATH = os.getenv("SSL_ARCHIVE_DB", "database/apiArchive.db")
+
+ARCHIVED_ENDPOINTS = {
+    "/index/schedule",
+    "/index/standings",
+    "/index/boxscore",
+}
+
+
+def is_archivable(endpoint, params, current_season):
+    """True for the archived endpoints when the requested season is finished."""
+    if urlsplit(endpoint).path not in ARCHIVED_ENDPOINTS:
+        return False
+    return is_historical(params, current_season)
+
+
+class ArchiveStore:
+    def __init__(self, path = ARCHIVE_DB_PATH):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok = True)
+            self._conn = sqlite3.connect(self.path, check_same_thread = False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS apiSnapshot (
+                    url TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    fetchedAt REAL NOT NULL,
+                    PRIMARY KEY (url, params)
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _params_key(key):
+        # key is api_cache.cache_key(): (url, sorted tuple of (name, value))
+        return json.dumps(key[1])
+
+    def get(self, key):
+        """Returns the stored response body for a cache key, or None."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body FROM apiSnapshot WHERE url = ? AND params = ?",
+                (key[0], self._params_key(key)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, body):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT INTO apiSnapshot (url, params, body, fetchedAt)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(url, params) DO UPDATE SET body=excluded.body, fetchedAt=excluded.fetchedAt
+                """,
+                (key[0], self._params_key(key), body, time.time()),
+            )
+            conn.commit()
+
+    async def aget(self, key):
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key, body):
+        await asyncio.to_thread(self.put, key, body)
+
+    def count(self):
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM apiSnapshot").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+## Pre-warming from the command line:
+##   python archive_store.py 1-25
+async def prewarm(seasons, store):
+    from api_client import APIClient
+    from season_provider import season_provider
+    from utils import (
+        SCORESAPIBASEURL,
+        STANDINGSAPIBASEURL,
+        BOXSCOREAPIBASEURL,
+    )
+
+    async with APIClient(archive = store, current_season = lambda: season_provider.current) as api:
+        current = await season_provider.refresh(api)
+        for season in seasons:
+            if season >= current:
+                print(f"Skipping S{season}: season is not finished yet")
+                continue
+
+            schedule = await api.get_json(
+                SCORESAPIBASEURL, params = {"season": season, "league": "ALL"}
+            )
+            for league_id in (1, 2):
+                await api.get_json(
+                    STANDINGSAPIBASEURL, params = {"season": season, "league": league_id}
+                )
+
+            # Boxscores are looked up from either side of the match
+            lookups = [
+                {
+                    "season": season,
+                    "league": match.get("MatchType"),
+                    "matchday": str(match.get("MatchDay")),
+                    "team": team,
+                }
+                for match in schedule
+                if match.get("HomeScore") is not None
+                for team in (match.get("Home"), match.get("Away"))
+            ]
+            results = await asyncio.gather(
+                *(api.get_json(BOXSCOREAPIBASEURL, params = p) for p in lookups),
+                return_exceptions = True,
+            )
+            failed = sum(isinstance(r, Exception) for r in results)
+            print(f"S{season}: {len(schedule)} matches, {len(lookups) - failed} boxscores archived, {failed} failed")
+
+    print(f"Archive now holds {store.count()} responses in {store.path}")
+
+
+def parse_seasons(text):
+    seasons = []
+    for part in text.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            seasons.extend(range(int(start), int(end) + 1))
+        else:
+            seasons.append(int(part))
+    return seasons
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Pre-warm the archive of finished SSL seasons.")
+    parser.add_argument("seasons", help = "Seasons to archive, e.g. 1-25 or 20,22,24")
+    parser.add_argument("--db", default = ARCHIVE_DB_PATH, help = "Path of the archive database")
+    args = parser.parse_args()
+
+    store = ArchiveStore(args.db)
+    try:
+        asyncio.run(prewarm(parse_seasons(args.seasons), store))
+    finally:
+        store.close()
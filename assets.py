@@ -0,0 +1,122 @@
+import os
+import threading
+from PIL import Image, ImageFont
+
+#### ASSET CACHE ####
+## Decoded/resized images and loaded fonts, kept for the life of the process
+## so repeated renders never touch the filesystem.
+FONT_DIR = "./fonts"
+
+## What the renderers ask for, loaded up front by preload()
+PRELOAD_LOGO_SIZES = [
+    ((150, 150), Image.Resampling.BICUBIC),  # Matchup images
+    ((48, 48), Image.Resampling.LANCZOS),    # Standings rows
+]
+PRELOAD_FONT_SIZES = [22, 24, 28, 32, 40, 52, 65, 110, 135]
+
+
+def _key_path(path):
+    return os.path.normpath(path)
+
+
+class AssetCache:
+    def __init__(self):
+        self._images = {}  # (path, size, mode, resample) -> Image
+        self._sizes = {}   # path -> (width, height) of the source file
+        self._fonts = {}   # (path, size) -> FreeTypeFont
+        self._lock = threading.Lock()
+        self.image_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def source_size(self, path):
+        """Returns the (width, height) of an image file, read once."""
+        key = _key_path(path)
+        size = self._sizes.get(key)
+        if size is None:
+            with Image.open(path) as source:
+                size = self._sizes.setdefault(key, source.size)
+        return size
+
+    def image(self, path, size = None, mode = "RGBA", resample = Image.Resampling.BICUBIC):
+        """Returns a decoded image, converted to mode and resized to size.
+
+        Only the requested variant is kept; the logos are 1600px squares, so
+        full size decodes are not cached unless asked for with size=None.
+        The returned image is shared: paste it, do not draw on it.
+        """
+        key = (_key_path(path), tuple(size) if size else None, mode, resample if size else None)
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = self._decode(path, mode)
+        if size is not None:
+            image = image.resize(tuple(size), resample)
+        return self._store(key, image)
+
+    def _decode(self, path, mode):
+        with Image.open(path) as source:
+            self._sizes.setdefault(_key_path(path), source.size)
+            return source.convert(mode)
+
+    def _store(self, key, image):
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = image
+                self.image_bytes += image.width * image.height * len(image.getbands())
+            return self._images[key]
+
+    def font(self, path, size):
+        """Returns a cached ImageFont.truetype(path, size)."""
+        key = (_key_path(path), size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = ImageFont.truetype(path, size)
+        with self._lock:
+            return self._fonts.setdefault(key, font)
+
+    def preload(self, logo_paths, font_dir = FONT_DIR):
+        """Loads the given logos at the sizes the renderers use, and every font."""
+        for path in sorted(set(logo_paths)):
+            try:
+                # Decode the large source once and derive every size from it
+                full = self._decode(path, "RGBA")
+                for size, resample in PRELOAD_LOGO_SIZES:
+                    key = (_key_path(path), size, "RGBA", resample)
+                    self._store(key, full.resize(size, resample))
+            except Exception as e:
+                print(f"Could not preload {path}: {e}")
+
+        for filename in sorted(os.listdir(font_dir)):
+            if not filename.lower().endswith((".ttf", ".otf")):
+                continue
+            for size in PRELOAD_FONT_SIZES:
+                try:
+                    self.font(os.path.join(font_dir, filename), size)
+                except Exception as e:
+                    print(f"Could not preload {filename} at {size}: {e}")
+
+    def stats(self):
+        return {
+            "images": len(self._images),
+            "image_bytes": self.image_bytes,
+            "fonts": len(self._fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+ASSETS = AssetCache()
+
+def get_image(path, size = None, mode = "RGBA", resample = Image.Resampling.BICUBIC):
+    return ASSETS.image(path, size, mode, resample)
+
+def get_font(path, size):
+    return ASSETS.font(path, size)
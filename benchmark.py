@@ -0,0 +1,354 @@
+"""Benchmarks for the bot's rendering and data paths.
+
+Runs offline against the API fixtures in benchmark_fixtures.py and the
+bundled graphics/ and fonts/ assets. For every case it reports the median
+wall and CPU time, the peak Python heap allocation, the number of Pillow
+images allocated and the size of the output.
+
+    python benchmark.py                  run every case
+    python benchmark.py -k standings     run the cases whose name contains "standings"
+    python benchmark.py --compare        compare against benchmarks/baseline.json,
+                                         exit status 1 on a regression
+    python benchmark.py --save           store the results as the new baseline
+    python benchmark.py --record         re-record the fixtures from the live API
+
+Timings depend on the machine, so save a baseline before a change and
+compare after it on the same machine. Allocation counts and output sizes
+are stable across machines and are compared with a tighter tolerance.
+"""
+import os
+import gc
+import io
+import sys
+import json
+import time
+import inspect
+import asyncio
+import argparse
+import platform
+import statistics
+import tracemalloc
+from dotenv import load_dotenv
+
+# Asset and font paths are relative to the repository root
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(".secrets/.env")
+# cogs.milestones reads it at import; the benchmarks never connect to Discord
+os.environ.setdefault("DISCORD_TEST_ID", "0")
+
+import discord
+import numpy as np
+import pandas as pd
+import PIL
+from PIL import Image
+
+from api_client import APIClient, set_client, get_client
+from utils import (
+    MAJOR_LEAGUE_TEAMS_LIST,
+    LEAGUEIDMAPPING,
+    MILESTONES,
+    getAPI,
+    get_team_colors_from_api,
+)
+from matchup_image import create_matchup_image
+from welcome_image import create_welcome_image, WELCOME_IMAGE_DIR
+from career_stats import career_stats, CAREEROUTFIELDAPIURL
+from cogs.standings import fetch_standings, standings_render_args
+from cogs.leaders import generate_stat_sheet_image
+from cogs.milestones import Milestones
+from benchmark_fixtures import (
+    FixtureClient,
+    record_fixtures,
+    synth_avatar,
+    BENCH_SEASON,
+    DRAFTCLASSAPIURL,
+)
+
+BASELINE_PATH = "./benchmarks/baseline.json"
+DEFAULT_REPEAT = 10
+DEFAULT_WARMUP = 2
+TIME_TOLERANCE = 0.25   # Relative slowdown reported as a regression
+SIZE_TOLERANCE = 0.05   # Same, for allocations and output size
+
+
+#### CASES ####
+## Each case is an async setup function that loads its inputs through the
+## fixture client and returns the zero-argument callable to measure. The
+## callable may return a coroutine.
+CASES = {}
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("matchup_image")
+async def bench_matchup_image():
+    colors = await get_team_colors_from_api()
+    home, away = MAJOR_LEAGUE_TEAMS_LIST[:2]
+    # Only the two teams' colors, as cogs.scores sends them
+    colors = {t: colors[t] for t in (home, away) if t in colors}
+    return lambda: create_matchup_image(home, 3, away, 1, colors)
+
+
+async def standings_case(division):
+    data = await fetch_standings(BENCH_SEASON, LEAGUEIDMAPPING["major"])
+    fn, *args = standings_render_args(data, "major", BENCH_SEASON, division)
+    return lambda: fn(*args)
+
+
+@case("standings_image")
+async def bench_standings_image():
+    return await standings_case("1")
+
+
+@case("two_divisions_image")
+async def bench_two_divisions_image():
+    return await standings_case("all")
+
+
+@case("stat_sheet_image")
+async def bench_stat_sheet_image():
+    data = await getAPI(DRAFTCLASSAPIURL, params = {"class": BENCH_SEASON})
+    return lambda: generate_stat_sheet_image(data, f"S{BENCH_SEASON}")
+
+
+@case("milestone_embed")
+async def bench_milestone_embed():
+    # Career table and index loaded by the warm-up runs
+    return lambda: Milestones.milestoneEmbed("goals", MILESTONES["goals"], None)
+
+
+@case("milestone_embed_league")
+async def bench_milestone_embed_league():
+    return lambda: Milestones.milestoneEmbed("goals", MILESTONES["goals"], LEAGUEIDMAPPING["major"])
+
+
+@case("milestone_embed_cold")
+async def bench_milestone_embed_cold():
+    # Includes decoding the career table, the schema and building the index
+    async def run():
+        career_stats.invalidate()
+        get_client().cache.invalidate(CAREEROUTFIELDAPIURL)
+        return await Milestones.milestoneEmbed("goals", MILESTONES["goals"], None)
+    return run
+
+
+@case("welcome_card")
+async def bench_welcome_card():
+    background = sorted(os.listdir(WELCOME_IMAGE_DIR))[0]
+    avatar = synth_avatar()
+    return lambda: create_welcome_image(background, avatar, "Benchmark User")
+
+
+#### MEASUREMENT ####
+def output_size(result):
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    if isinstance(result, io.BytesIO):
+        return len(result.getvalue())
+    if isinstance(result, discord.Embed):
+        return len(json.dumps(result.to_dict()))
+    return None
+
+
+def call(loop, fn):
+    result = fn()
+    if inspect.isawaitable(result):
+        result = loop.run_until_complete(result)
+    return result
+
+
+def measure(loop, fn, repeat, warmup):
+    for _ in range(warmup):
+        call(loop, fn)
+
+    walls, cpus = [], []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            wall, cpu = time.perf_counter(), time.process_time()
+            result = call(loop, fn)
+            cpus.append(time.process_time() - cpu)
+            walls.append(time.perf_counter() - wall)
+    finally:
+        gc.enable()
+
+    # Separate run: tracing slows everything down. Pillow keeps image
+    # buffers outside the Python heap, so those are counted separately.
+    images = Image.core.get_stats()["new_count"]
+    tracemalloc.start()
+    try:
+        call(loop, fn)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    images = Image.core.get_stats()["new_count"] - images
+
+    return {
+        "wall_ms": round(statistics.median(walls) * 1000, 3),
+        "wall_min_ms": round(min(walls) * 1000, 3),
+        "cpu_ms": round(statistics.median(cpus) * 1000, 3),
+        "alloc_peak_kib": round(peak / 1024, 1),
+        "images": images,
+        "output_bytes": output_size(result),
+    }
+
+
+def environment(client):
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pillow": PIL.__version__,
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "fixtures": client.digest(),
+    }
+
+
+def run(names, repeat, warmup):
+    client = FixtureClient()
+    set_client(client)
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        for name in names:
+            fn = loop.run_until_complete(CASES[name]())
+            results[name] = measure(loop, fn, repeat, warmup)
+            print_row(name, results[name])
+    finally:
+        loop.close()
+    return {"environment": environment(client), "repeat": repeat, "cases": results}
+
+
+#### REPORTING ####
+## (result key, label, relative tolerance, absolute change that is never
+## a regression). Time tolerances are replaced by --tolerance.
+COLUMNS = [
+    ("wall_ms", "wall ms", TIME_TOLERANCE, 0.5),
+    ("cpu_ms", "cpu ms", TIME_TOLERANCE, 0.5),
+    ("alloc_peak_kib", "peak KiB", SIZE_TOLERANCE, 4),
+    ("images", "images", SIZE_TOLERANCE, 0),
+    ("output_bytes", "output B", SIZE_TOLERANCE, 0),
+]
+
+def print_header():
+    print(f"{'case':<24}" + "".join(f"{label:>12}" for _, label, _, _ in COLUMNS))
+
+
+def print_row(name, result):
+    cells = "".join(f"{'-' if result[key] is None else result[key]:>12}" for key, _, _, _ in COLUMNS)
+    print(f"{name:<24}{cells}")
+
+
+def regressions(name, result, baseline, time_tolerance):
+    """Returns a description of every metric of result that is worse than
+    baseline by more than its tolerance.
+    """
+    found = []
+    for key, label, tolerance, noise in COLUMNS:
+        new, old = result.get(key), baseline.get(key)
+        if new is None or old is None or new - old <= noise:
+            continue
+        if key.endswith("_ms"):
+            tolerance = time_tolerance
+        if new > old * (1 + tolerance):
+            change = f"+{(new / old - 1) * 100:.0f}%" if old else "new"
+            found.append(f"{name}: {label} {old} -> {new} ({change})")
+    return found
+
+
+def compare(report, baseline, time_tolerance):
+    """Prints the change of every case against baseline and returns the
+    regressions.
+    """
+    if baseline["environment"]["fixtures"] != report["environment"]["fixtures"]:
+        print("Warning: the baseline was measured on different fixtures")
+
+    print()
+    print(f"{'vs baseline':<24}" + "".join(f"{label:>12}" for _, label, _, _ in COLUMNS))
+    found = []
+    for name, result in report["cases"].items():
+        old = baseline["cases"].get(name)
+        if old is None:
+            print(f"{name:<24}{'(no baseline)':>12}")
+            continue
+        cells = ""
+        for key, _, _, _ in COLUMNS:
+            if result.get(key) is None or not old.get(key):
+                cells += f"{'-':>12}"
+            else:
+                cells += f"{(result[key] / old[key] - 1) * 100:>+11.1f}%"
+        print(f"{name:<24}{cells}")
+        found += regressions(name, result, old, time_tolerance)
+    return found
+
+
+def load_baseline(path = BASELINE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(report, path = BASELINE_PATH):
+    # Cases not run this time keep their previous baseline
+    if os.path.isfile(path):
+        previous = load_baseline(path)
+        report = {**report, "cases": {**previous["cases"], **report["cases"]}}
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent = 2, sort_keys = True)
+        f.write("\n")
+    print(f"Saved baseline to {path}")
+
+
+async def record():
+    async with APIClient() as client:
+        await record_fixtures(client)
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark the bot's rendering and data paths.")
+    parser.add_argument("-k", dest = "filter", help = "only run cases whose name contains this")
+    parser.add_argument("--repeat", type = int, default = DEFAULT_REPEAT, help = "timed runs per case")
+    parser.add_argument("--warmup", type = int, default = DEFAULT_WARMUP, help = "untimed runs per case")
+    parser.add_argument("--compare", action = "store_true", help = "compare against the stored baseline")
+    parser.add_argument("--save", action = "store_true", help = "store the results as the baseline")
+    parser.add_argument("--tolerance", type = float, default = TIME_TOLERANCE, help = "allowed relative slowdown")
+    parser.add_argument("--baseline", default = BASELINE_PATH, help = "baseline file")
+    parser.add_argument("--record", action = "store_true", help = "re-record the fixtures from the live API")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        asyncio.run(record())
+        return 0
+
+    names = [name for name in CASES if not args.filter or args.filter in name]
+    if not names:
+        print(f"No case matches {args.filter!r}. Cases: {', '.join(CASES)}")
+        return 2
+
+    print_header()
+    report = run(names, args.repeat, args.warmup)
+
+    status = 0
+    if args.compare:
+        found = compare(report, load_baseline(args.baseline), args.tolerance)
+        print()
+        if found:
+            print("Regressions:")
+            for line in found:
+                print("  " + line)
+            status = 1
+        else:
+            print("No regressions.")
+    if args.save:
+        save_baseline(report, args.baseline)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
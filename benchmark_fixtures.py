@@ -0,0 +1,218 @@
+import io
+import os
+import json
+import random
+import hashlib
+from PIL import Image
+
+from api_cache import cache_key
+from api_client import APIClient, APIError
+from json_decode import decode
+from utils import (
+    STANDINGSAPIBASEURL,
+    GETORGAPIURL,
+    MAJOR_LEAGUE_TEAMS_LIST,
+    MINOR_LEAGUE_TEAMS_LIST,
+    MILESTONES,
+)
+from career_stats import CAREEROUTFIELDAPIURL, KEEPER_STATS
+from active_roster import ACTIVEPLAYERSAPIURL
+
+#### BENCHMARK FIXTURES ####
+## API responses the benchmarks run against. A recorded body in
+## benchmarks/fixtures/<name>.json is used when present (see
+## `python benchmark.py --record`); otherwise a deterministic body of the
+## same shape and a realistic size is generated, so the suite runs offline.
+FIXTURE_DIR = "./benchmarks/fixtures"
+DRAFTCLASSAPIURL = "https://api.simulationsoccer.com/player/getDraftClass"
+
+BENCH_SEASON = 26
+CAREER_PLAYERS = 3000
+ACTIVE_PLAYERS = 900
+DRAFT_CLASS_SIZE = 120
+SEED = 2024
+
+
+def _rng(name):
+    # One generator per fixture, so adding a fixture does not change the others
+    return random.Random(f"{SEED}:{name}")
+
+
+def _player_name(rng, pid):
+    first = rng.choice(["Alex", "Sam", "Jordan", "Kai", "Luca", "Mateo", "Noah", "Yuki", "Omar", "Ivan"])
+    last = rng.choice(["Silva", "Novak", "Okafor", "Tanaka", "Moreau", "Schmidt", "Rossi", "Kowalski", "Haddad", "Eriksen"])
+    return f"{first} {last} {pid}"
+
+
+def synth_organizations():
+    rng = _rng("organizations")
+    return [
+        {
+            "id": i,
+            "name": team,
+            "abbreviation": team[:3].upper(),
+            "primaryColor": "#%06X" % rng.randrange(0x1000000),
+            "secondaryColor": "#%06X" % rng.randrange(0x1000000),
+        }
+        for i, team in enumerate(MAJOR_LEAGUE_TEAMS_LIST + MINOR_LEAGUE_TEAMS_LIST)
+    ]
+
+
+def synth_standings():
+    rng = _rng("standings")
+    rows = []
+    for i, team in enumerate(MAJOR_LEAGUE_TEAMS_LIST):
+        w, d = rng.randint(2, 14), rng.randint(0, 6)
+        l = 22 - w - d
+        gf, ga = rng.randint(15, 50), rng.randint(15, 50)
+        rows.append({
+            "team": team,
+            "matchday": "1" if i < 6 else "2",
+            "mp": w + d + l,
+            "w": w,
+            "d": d,
+            "l": l,
+            "gf": gf,
+            "ga": ga,
+            "gd": gf - ga,
+            "p": 3*w + d,
+        })
+    return rows
+
+
+def synth_draft_class():
+    rng = _rng("draft class")
+    return [
+        {
+            "pid": pid,
+            "name": _player_name(rng, pid),
+            "username": f"user{pid}",
+            "tpe": rng.randint(350, 1800),
+            "class": f"S{BENCH_SEASON}",
+            "position": rng.choice(["GK", "CB", "FB", "CDM", "CM", "AM", "W", "ST"]),
+            "team": rng.choice(MAJOR_LEAGUE_TEAMS_LIST + MINOR_LEAGUE_TEAMS_LIST),
+        }
+        for pid in range(10000, 10000 + DRAFT_CLASS_SIZE)
+    ]
+
+
+def _career_stats(rng, scale):
+    stats = {}
+    for stat, base in MILESTONES.items():
+        if stat in KEEPER_STATS:
+            continue
+        # Long tailed, with enough players near every milestone
+        value = rng.expovariate(1.0) * base[0] * 0.6 * scale
+        stats[stat] = round(value, 1) if stat == "distance run (km)" else int(value)
+    return stats
+
+
+def synth_career(by_league):
+    rng = _rng(f"career {by_league}")
+    clubs = MAJOR_LEAGUE_TEAMS_LIST + MINOR_LEAGUE_TEAMS_LIST
+    rows = []
+    for pid in range(1, CAREER_PLAYERS + 1):
+        name = _player_name(rng, pid)
+        leagues = ["Major League", "Minor League"] if by_league == "True" else ["ALL"]
+        for league in leagues:
+            row = {"name": name, "pid": pid, "club": rng.choice(clubs)}
+            if by_league == "True":
+                row["league"] = league
+            row.update(_career_stats(rng, 0.6 if league == "Minor League" else 1.0))
+            # Columns the bot does not read, present in the real response
+            row.update({
+                "shots on target": rng.randint(0, 400),
+                "fouls": rng.randint(0, 200),
+                "yellow cards": rng.randint(0, 40),
+                "red cards": rng.randint(0, 5),
+                "average rating": round(rng.uniform(5.5, 8.5), 2),
+                "player of the match": rng.randint(0, 30),
+            })
+            rows.append(row)
+    return rows
+
+
+def synth_active_players():
+    rng = _rng("active players")
+    pids = sorted(rng.sample(range(1, CAREER_PLAYERS + 1), ACTIVE_PLAYERS))
+    return [
+        {"pid": pid, "name": f"Active {pid}", "username": f"user{pid}", "status": "Active"}
+        for pid in pids
+    ]
+
+
+def synth_avatar():
+    # 256x256 RGBA gradient, about the size of a Discord avatar
+    avatar = Image.linear_gradient("L").convert("RGBA")
+    buf = io.BytesIO()
+    avatar.save(buf, format = "PNG")
+    return buf.getvalue()
+
+
+class Fixture:
+    def __init__(self, name, endpoint, params, synth):
+        self.name = name
+        self.endpoint = endpoint
+        self.params = params
+        self.synth = synth
+
+    @property
+    def path(self):
+        return os.path.join(FIXTURE_DIR, f"{self.name}.json")
+
+    def recorded(self):
+        return os.path.isfile(self.path)
+
+    def body(self):
+        if self.recorded():
+            with open(self.path, "rb") as f:
+                return f.read()
+        return json.dumps(self.synth()).encode()
+
+
+FIXTURES = [
+    Fixture("organizations", GETORGAPIURL, None, synth_organizations),
+    Fixture("standings", STANDINGSAPIBASEURL, {"season": BENCH_SEASON, "league": 1}, synth_standings),
+    Fixture("draft_class", DRAFTCLASSAPIURL, {"class": BENCH_SEASON}, synth_draft_class),
+    Fixture("career_outfield", CAREEROUTFIELDAPIURL, {"name": "ALL", "league": "False"}, lambda: synth_career("False")),
+    Fixture("career_outfield_league", CAREEROUTFIELDAPIURL, {"name": "ALL", "league": "True"}, lambda: synth_career("True")),
+    Fixture("active_players", ACTIVEPLAYERSAPIURL, {"active": "true"}, synth_active_players),
+]
+
+
+class FixtureClient(APIClient):
+    """APIClient that answers from FIXTURES instead of the network.
+
+    Bodies go through the same decoding and caching as live responses.
+    Requests without a fixture fail with HTTP 404.
+    """
+
+    def __init__(self, fixtures = FIXTURES):
+        super().__init__()
+        self.bodies = {cache_key(f.endpoint, f.params): f.body() for f in fixtures}
+
+    async def _fetch(self, endpoint, params, key, ttl, decoder):
+        body = self.bodies.get(cache_key(endpoint, params))
+        if body is None:
+            raise APIError(404, endpoint)
+        data = await decode(body, decoder)
+        self.cache.put(key, data, len(body), ttl)
+        return data
+
+    def digest(self):
+        """Hash of every fixture body, stored with the baselines."""
+        sha = hashlib.sha256()
+        for key in sorted(self.bodies, key = repr):
+            sha.update(repr(key).encode())
+            sha.update(self.bodies[key])
+        return sha.hexdigest()[:16]
+
+
+async def record_fixtures(client, fixtures = FIXTURES):
+    """Fetches every fixture from the live API into FIXTURE_DIR."""
+    os.makedirs(FIXTURE_DIR, exist_ok = True)
+    for fixture in fixtures:
+        body = await client.get_bytes(fixture.endpoint, params = fixture.params)
+        with open(fixture.path, "wb") as f:
+            f.write(body)
+        print(f"Recorded {fixture.name}: {len(body) / 1024:.0f} KiB")
@@ -3,9 +3,15 @@ from discord.ext import commands
 from dotenv import load_dotenv
 import os  # default module
 import asyncio
-import requests
 import logging
-from db_utils import *
+from db_utils import user_db
+from api_client import APIClient, set_client
+from archive_store import ArchiveStore
+from utils import getAPI, get_team_logo_path, ALL_MAIN_TOURNAMENT_TEAMS, DEFAULT_LOGO_PATH
+from season_provider import season_provider
+from active_roster import active_roster
+from assets import ASSETS
+from render_pool import render_executor
 
 # logging.basicConfig(level = logging.DEBUG)
 
@@ -50,37 +56,26 @@ async def store(interaction: discord.Interaction, *, username: str):
     discord_id = interaction.user.id
 
     # Get player information from username via the SSL API
-    player = requests.get(
-        'https://api.simulationsoccer.com/player/getPlayer?username='
-        + username.replace(" ", "%20")
+    playerData = await getAPI(
+        'https://api.simulationsoccer.com/player/getPlayer',
+        params={"username": username},
     )
-    playerData = pd.DataFrame(eval(player.content))
-    if playerData.shape[1] < 2:
+    if playerData is None or playerData.shape[1] < 2:
         await interaction.response.send_message(
             "Please check the spelling of the username as none was found with that name."
         )
         return
     else:
         playerName = playerData.iloc[0]['name']
-        session = create_connection()
-        with session:
-            table = pd.read_sql_query(
-                "SELECT * from discordUser WHERE discordID = " + str(discord_id),
-                session,
+        old_link = await user_db.store_user(discord_id, username, playerName)
+        if old_link is not None:
+            await interaction.response.send_message(
+                f"Changed association from: {old_link.username} -> {username}"
+            )
+        else:
+            await interaction.response.send_message(
+                f"Associated Discord account with username: {username}"
             )
-            if table.shape[0] > 0:
-                old_name = table["username"][0]
-                update_row(session, [discord_id, username, playerName, discord_id])
-                await interaction.response.send_message(
-                    f"Changed association from: {old_name} -> {username}"
-                )
-            else:
-                add_row(session, [discord_id, username, playerName])
-                await interaction.response.send_message(
-                    f"Associated Discord account with username: {username}"
-                )
-
-        session.close()
 
 
 @bot.tree.command(name="whoami", description="Shows who the Bot thinks you are.")
@@ -88,31 +83,25 @@ async def whoami(interaction: discord.Interaction):
     discord_id = interaction.user.id
     discord_user = interaction.user.name
 
-    session = create_connection()
-    with session:
-        table = pd.read_sql_query(
-            "SELECT * from discordUser WHERE discordID = " + str(discord_id),
-            session,
+    link = await user_db.get_user(discord_id)
+    if link is not None:
+        embed = discord.Embed(color=discord.Color(0xBD9523))
+        embed.title = discord_user
+        embed.add_field(
+            name="Forum User",
+            value=link.username,
+            inline=True,
+        )
+        embed.add_field(
+            name="Player",
+            value=link.player,
+            inline=False,
+        )
+        await interaction.response.send_message(embed=embed)
+    else:
+        await interaction.response.send_message(
+            "You have no user stored. Use /store to store your forum username."
         )
-        if table.shape[0] > 0:
-            embed = discord.Embed(color=discord.Color(0xBD9523))
-            embed.title = discord_user
-            embed.add_field(
-                name="Forum User",
-                value=table.iloc[0]['username'],
-                inline=True,
-            )
-            embed.add_field(
-                name="Player",
-                value=table.iloc[0]['player'],
-                inline=False,
-            )
-            await interaction.response.send_message(embed=embed)
-        else:
-            await interaction.response.send_message(
-                "You have no user stored. Use /store to store your forum username."
-            )
-    session.close()
 
 
 @bot.tree.command(name="reload", description="Reloading named cogs")
@@ -131,9 +120,45 @@ async def load():
 
 
 async def main():
-    async with bot:
-        await load()
-        await bot.start(TOKEN)
-
-
-asyncio.run(main())
+    # bot.start() does not configure logging the way bot.run() does
+    discord.utils.setup_logging(level=logging.INFO)
+
+    # Decode logos/trophies and load fonts once, off the event loop
+    logo_paths = [get_team_logo_path(team) for team in ALL_MAIN_TOURNAMENT_TEAMS]
+    logo_paths.append(DEFAULT_LOGO_PATH)
+    await asyncio.to_thread(ASSETS.preload, logo_paths)
+    print(f"Preloaded assets: {ASSETS.stats()}")
+
+    # Image rendering runs in worker processes, each with its own warm assets
+    render_executor.start(logo_paths)
+    await render_executor.warm_up()
+
+    # One pooled API session for the whole bot, closed on shutdown
+    archive = ArchiveStore()
+    await user_db.start()
+    try:
+        async with APIClient(
+            archive=archive,
+            current_season=lambda: season_provider.current,
+        ) as api:
+            bot.api = api
+            set_client(api)
+            # Resolved in the background; cogs read it lazily
+            season_provider.start()
+            active_roster.start()
+            try:
+                async with bot:
+                    await load()
+                    await bot.start(TOKEN)
+            finally:
+                await active_roster.stop()
+                await season_provider.stop()
+    finally:
+        render_executor.shutdown()
+        await user_db.close()
+        archive.close()
+
+
+# Guarded so render worker processes can import this module safely
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+import os
+import time
+import asyncio
+import logging
+from dotenv import load_dotenv
+
+from utils import getAPI
+from table_schema import CAREER_SCHEMA, memory_bytes
+
+load_dotenv(".secrets/.env")
+
+logger = logging.getLogger(__name__)
+
+#### CAREER STATS REPOSITORY ####
+## The career totals of every player (careerOutfield / careerKeeper) are
+## fetched once per refresh interval and served from memory, so switching
+## between milestone and record stats does not hit the API.
+CAREERKEEPERAPIURL = "https://api.simulationsoccer.com/index/careerKeeper"
+CAREEROUTFIELDAPIURL = "https://api.simulationsoccer.com/index/careerOutfield"
+CAREER_REFRESH_SECONDS = int(os.getenv("SSL_CAREER_REFRESH", 900))
+
+KEEPER_STATS = ['saves', 'clean sheets']
+SAVES_COLUMNS = ['saves parried', 'saves tipped', 'saves held']
+
+
+def career_url(stat):
+    return CAREERKEEPERAPIURL if stat in KEEPER_STATS else CAREEROUTFIELDAPIURL
+
+
+def add_derived_columns(data):
+    # Total saves is not returned by the API
+    if 'saves' not in data.columns and all(c in data.columns for c in SAVES_COLUMNS):
+        value = data['saves parried'] + data['saves tipped'] + data['saves held']
+        data.insert(len(data.columns)-1, 'saves', value)
+    return data
+
+
+class CareerStatsRepository:
+    def __init__(self, refresh_seconds = CAREER_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._tables = {}   # (url, league, club) -> (loaded at, DataFrame)
+        self._derived = {}  # (url, league, club) -> {builder: result} for the loaded table
+        self._locks = {}
+
+    async def table(self, stat, by_league = False, by_club = None):
+        """Career totals of all players from the table that holds stat.
+
+        :param by_league: split the totals per league
+        :param by_club: split the totals per club; None leaves the club
+            parameter out of the request, as the milestone lookups do
+        :return: DataFrame, or None if it could not be loaded. Shared
+            between callers, so filter it but do not modify it.
+        """
+        key = self._key(stat, by_league, by_club)
+
+        entry = self._tables.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.refresh_seconds:
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed it while we waited
+            entry = self._tables.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.refresh_seconds:
+                return entry[1]
+
+            params = {"name": "ALL", "league": key[1]}
+            if key[2] is not None:
+                params["club"] = key[2]
+            data = await getAPI(key[0], params = params)
+
+            if data is None or data.empty:
+                # Keep serving the last good copy if the refresh failed
+                return entry[1] if entry is not None else None
+
+            # Only the columns the indexes read, in compact dtypes
+            raw_bytes = memory_bytes(data)
+            data = CAREER_SCHEMA.apply(add_derived_columns(data))
+            self._tables[key] = (time.monotonic(), data)
+            logger.info(
+                f"Loaded career table {key}: {len(data)} rows, "
+                f"{raw_bytes / 1024:.0f} KiB as fetched, {memory_bytes(data) / 1024:.0f} KiB stored"
+            )
+            self._derived[key] = {}
+            return data
+
+    async def derived(self, builder, stat, by_league = False, by_club = None):
+        """Returns builder(table, by_league = ..., by_club = ...) for the
+        table that holds stat.
+
+        The result is computed once per table load and rebuilt after each
+        refresh, so indexes over the career data never go stale.
+        """
+        data = await self.table(stat, by_league, by_club)
+        if data is None:
+            return None
+
+        results = self._derived.setdefault(self._key(stat, by_league, by_club), {})
+        result = results.get(builder)
+        if result is None:
+            result = results[builder] = builder(data, by_league = by_league, by_club = by_club)
+        return result
+
+    @staticmethod
+    def _key(stat, by_league, by_club):
+        return (career_url(stat), str(by_league), None if by_club is None else str(by_club))
+
+    def memory_report(self):
+        """Bytes held per loaded table, keyed by (url, league, club)."""
+        return {key: memory_bytes(data) for key, (_, data) in self._tables.items()}
+
+    def invalidate(self):
+        self._tables.clear()
+        self._derived.clear()
+
+
+career_stats = CareerStatsRepository()
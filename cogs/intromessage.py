@@ -2,12 +2,13 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import os
-import easy_pil
+import io
 import random
 from dotenv import load_dotenv
-from PIL import ImageFilter, ImageFont
-from utils import DEFAULT_FONT_PATH
-from db_utils import *
+from api_client import get_client
+from render_pool import render_executor
+from welcome_image import create_welcome_image, WELCOME_IMAGE_DIR
+from db_utils import user_db
 
 
 load_dotenv(".secrets/.env")
@@ -43,11 +44,11 @@ class IntroMessage(commands.Cog):
             return
     
         guild_id = interaction.guild.id
-        current_status = get_welcome_status(guild_id)
+        current_status = await user_db.get_welcome_status(guild_id)
     
         # Flip the toggle
         new_status = not current_status
-        set_welcome_status(guild_id, new_status)
+        await user_db.set_welcome_status(guild_id, new_status)
     
         await interaction.response.send_message(
             f"Welcome messages are now **{'enabled' if new_status else 'disabled'}** for this server.",
@@ -60,7 +61,7 @@ class IntroMessage(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
-        if not get_welcome_status(member.guild.id):
+        if not await user_db.get_welcome_status(member.guild.id):
             return  # Skip if disabled
       
         welcome_channel = member.guild.system_channel
@@ -92,42 +93,26 @@ class IntroMessage(commands.Cog):
         else:
             welcome_message = f"Hello there {member.name}! Welcome to {member.guild.name}!"    
 
-        images = os.listdir("./graphics/welcome_images")
+        images = os.listdir(WELCOME_IMAGE_DIR)
         random_image = random.choice(images)
-        
-        bg = easy_pil.Editor(f"./graphics/welcome_images/{random_image}").resize((1920, 1080))
-        bg.image = bg.image.filter(ImageFilter.GaussianBlur(radius=5))
-
-        avatar_image = await easy_pil.load_image_async(str(member.avatar.url))
-        avatar = easy_pil.Editor(avatar_image).resize((250, 250)).circle_image()
-
-        # Fix the font module reference (easy_pil.Font, not easy.pil.Font)
-        font_big = ImageFont.truetype(DEFAULT_FONT_PATH, size=135)
-        font_small = ImageFont.truetype(DEFAULT_FONT_PATH, size=65)
-
-        bg.paste(avatar, (835, 340))
-        bg.ellipse((835, 340), 250, 250, outline="#ED9523", stroke_width=5)
 
-        x1, y1 = (960, 620) #Coordinates for the big welcome text in image
-        offsets = [(-4, 0), (4, 0), (0, -4), (0, 4)]
+        try:
+            avatar_bytes = await get_client().get_bytes(str(member.display_avatar.url))
 
-        # Draw outline by drawing text shifted in four directions
-        for dx, dy in offsets:
-            bg.text((x1 + dx, y1 + dy), f"Greetings!", font=font_big, color="#ffffff", align="center")
-        # Draw main text on top
-        bg.text((x1, y1), f"Greetings!", font=font_big, color="#070B51", align="center")
-
-        x2, y2 = (960, 800) #Coordinates for the small member count text in image
-        offset = 5
-        offsets = [(-offset, 0), (offset, 0), (0, -offset), (0, offset)]
+            # The card is rendered on the render pool, off the event loop
+            image_bytes = await render_executor.render(
+                create_welcome_image, random_image, avatar_bytes, member.name
+            )
+        except Exception as e:
+            # Avatar fetch or render failed: still welcome them, without the card
+            print(f"Error creating welcome image for {member.name}: {e}")
+            image_bytes = None
 
-        # Draw outline by drawing text shifted in four directions
-        for dx, dy in offsets:
-            bg.text((x2 + dx, y2 + dy),  f"{member.name} is here!", font=font_small, color="#ffffff", align="center")
-        # Draw main text on top
-        bg.text((x2, y2),  f"{member.name} is here!", font=font_small, color="#070B51", align="center")
+        if not image_bytes:
+            await welcome_channel.send(welcome_message)
+            return
 
-        image_file = discord.File(fp=bg.image_bytes, filename="welcome.png")  # Use a fixed filename for easy caching
+        image_file = discord.File(fp=io.BytesIO(image_bytes), filename="welcome.png")  # Use a fixed filename for easy caching
 
         await welcome_channel.send(welcome_message, file=image_file)
 
@@ -3,11 +3,10 @@ from discord.ext import commands
 from discord import app_commands
 import pandas as pd
 import typing
-import requests
-import json
 import io
 from PIL import Image, ImageDraw, ImageFont
-from utils import DEFAULT_FONT_PATH
+from utils import DEFAULT_FONT_PATH, getAPI
+from assets import get_font
 from dotenv import load_dotenv
 import os # default module
 
@@ -16,7 +15,7 @@ import os # default module
 def generate_stat_sheet_image(data, leader):
     #Prepare Data
     stat = data[["tpe", "name", "username"]].sort_values("tpe", ascending=False).head()
-    stat.columns = stat.columns.str.upper()
+    stat.columns = ["TPE", "PLAYER", "USER"]  # Column headers drawn below
     leaders = stat.to_dict('records')
     
     #Draw Image
@@ -26,8 +25,8 @@ def generate_stat_sheet_image(data, leader):
     TEXT_COLOR = "#FFFFFF"
     FONT_PATH = DEFAULT_FONT_PATH
     try:
-        TITLE_FONT = ImageFont.truetype(FONT_PATH, 32)
-        ROW_FONT = ImageFont.truetype(FONT_PATH, 24)
+        TITLE_FONT = get_font(FONT_PATH, 32)
+        ROW_FONT = get_font(FONT_PATH, 24)
     except IOError:
         TITLE_FONT = ImageFont.load_default()
         ROW_FONT = ImageFont.load_default()
@@ -88,13 +87,14 @@ class Leaders(commands.Cog):
     @app_commands.command(name='classleaders', description='Shows the draft class leaders for a specific class (number)')
     async def classleaders(self, interaction: discord.Interaction, season: typing.Optional[int] = None):
         if season is None:
-            info = requests.get('https://api.simulationsoccer.com/player/getDraftClass')
+            data = await getAPI('https://api.simulationsoccer.com/player/getDraftClass')
             leader = "Academy"
         else: 
-            info = requests.get('https://api.simulationsoccer.com/player/getDraftClass?class=' + str(season))
+            data = await getAPI('https://api.simulationsoccer.com/player/getDraftClass', params = {"class": season})
             leader = 'S' + str(season)
-         # Data formatting
-        data = pd.DataFrame(json.loads(info.content))
+        if data is None or data.empty:
+            await interaction.response.send_message("No players found for this class.")
+            return
         embed = discord.Embed(color = discord.Color(0xBD9523))
         embed.title = leader + ' Class Leaders'
          # TPE Leaders
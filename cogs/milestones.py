@@ -7,11 +7,14 @@ import typing
 import requests
 import json 
 import asyncio
-from db_utils import *
 from dotenv import load_dotenv
 import os
 
 from milestone_view import (MilestoneView, RecordView)
+from career_stats import career_stats
+from milestone_index import MilestoneIndex
+from record_index import RecordIndex
+from active_roster import active_roster
 
 from utils import (
   getAPI,
@@ -19,7 +22,6 @@ from utils import (
   GK_STAT_GROUPS,
   OUT_STAT_GROUPS,
   PLAYER_DATA_GROUPS,
-  CURRENT_SEASON,
   MILESTONES,
   TEAM_ABBREVIATIONS,
   league_by_id,
@@ -42,15 +44,15 @@ class Milestones(commands.Cog): # create a class for our cog that inherits from
     
     
     @staticmethod
-    async def milestoneEmbed(actives: pd.DataFrame, stat, base, league) -> discord.Embed:
+    async def milestoneEmbed(stat, base, league) -> discord.Embed:
         # Create and color the embed
         embed = discord.Embed(color = discord.Color(0xBD9523))
         
         if (league == None):
-          leagueGroup = "False"
+          leagueGroup = False
           leagueName = None
         else:
-          leagueGroup = "True"
+          leagueGroup = True
           leagueName = league_by_id.get(league)
         
         # Title
@@ -59,33 +61,19 @@ class Milestones(commands.Cog): # create a class for our cog that inherits from
         
         lines = {m: [] for m in base}
 
-        if stat in ['saves', 'clean sheets']:
-          url = "https://api.simulationsoccer.com/index/careerKeeper"
-        else:
-          url = "https://api.simulationsoccer.com/index/careerOutfield"
-        
-        data = await getAPI(url, params = {"name": "ALL", "league": leagueGroup})
+        # Precomputed per career table load; only the active filter runs here
+        index = await career_stats.derived(MilestoneIndex, stat, by_league = leagueGroup)
+        if index is None:
+          embed.add_field(name = "## No data ##", value = "Career stats are unavailable right now.", inline = False)
+          return embed
         
-        if stat == 'saves':
-          value = data['saves parried'] + data['saves tipped'] + data['saves held']
-          data.insert(len(data.columns)-1, stat, value)
+        actives = await active_roster.get()
         
-        data = data.loc[
-          (data['name'].isin(actives['name'])) & 
-          (data[stat] > 0.95*base[0]) &
-          ( True if leagueName is None else (data['league'] == leagueName))
-        ].sort_values(stat, ascending = False)
-        
-        for index, row in data.iterrows():
-          value = row[stat]
-          player = row['name']
-          pid = row['pid']
-          
-          for m in base:
-            if value < m and (value >= min(m * 0.95, (m - 5))):
-              lines[m].append(
-                f" { link_player(player, pid) } is { round(m - value, 2) } away from **{ m }** { stat.title() }!"
-              )
+        for m in base:
+          for player, pid, value in index.chasers(stat, leagueName, m, actives.pids):
+            lines[m].append(
+              f" { link_player(player, pid) } is { round(m - value, 2) } away from **{ m }** { stat.title() }!"
+            )
 
         for m in base:
 
@@ -113,17 +101,14 @@ class Milestones(commands.Cog): # create a class for our cog that inherits from
         """
         await interaction.response.defer()
         
-        actives = await getAPI("https://api.simulationsoccer.com/player/getAllPlayers", params = {"active": "true"})
-        
         stat, base = next(iter(MILESTONES.items()))
         
-        embed = await self.milestoneEmbed(actives, stat, base, league)
+        embed = await self.milestoneEmbed(stat, base, league)
         
         print("Get first embed")
         
         view = MilestoneView(
           self,
-          actives,
           league
         )
         
@@ -133,73 +118,55 @@ class Milestones(commands.Cog): # create a class for our cog that inherits from
         view.message = msg
 
     @staticmethod
-    async def recordEmbed(actives: pd.DataFrame, stat, league, team) -> discord.Embed:
+    async def recordEmbed(stat, league, team) -> discord.Embed:
         # Create and color the embed
         embed = discord.Embed(color = discord.Color(0xBD9523))
         
         if (league is None):
-          leagueGroup = "False"
+          leagueGroup = False
           leagueName = None
         else:
-          leagueGroup = "True"
+          leagueGroup = True
           leagueName = league_by_id.get(league)
           
         if (team is None):
           organization = None
-          orgGroup = "False"
+          orgGroup = False
         elif (TEAM_ABBREVIATIONS[team.lower()] is None):
           organization = None
-          orgGroup = "False"
+          orgGroup = False
         else:
           organization = TEAM_ABBREVIATIONS[team.lower()]
-          orgGroup = "True"
+          orgGroup = True
         
         # Title
         embed.title = f" { stat.title() } Record Chasers"
         embed.description = f"{ organization if organization is not None else ''} { leagueName if leagueName is not None else ''}"
         
-        if stat in ['saves', 'clean sheets']:
-          url = "https://api.simulationsoccer.com/index/careerKeeper"
-        else:
-          url = "https://api.simulationsoccer.com/index/careerOutfield"
+        # Precomputed per career table load for every league/club split
+        index = await career_stats.derived(RecordIndex, stat, by_league = leagueGroup, by_club = orgGroup)
+        entry = index.record(stat, leagueName, organization) if index is not None else None
+        if entry is None:
+          embed.add_field(name = "## No data ##", value = "Career stats are unavailable right now.", inline = False)
+          return embed
         
-        data = await getAPI(url, params = {"name": "ALL", "league": leagueGroup, "club": orgGroup})
+        active_pids = (await active_roster.get()).pids
         
-        if stat == 'saves':
-          value = data['saves parried'] + data['saves tipped'] + data['saves held']
-          data.insert(len(data.columns)-1, stat, value)
-        
-        dataFilter = filter_players(data, league = leagueName, club = organization)
-        
-        record = dataFilter.loc[
-          ( dataFilter[stat] == max(dataFilter[stat]) )
-        ]
-
-        recordValue = record[stat].iloc[0]
-        recordName = record['name']
-        recordPid = record['pid']
-        recordActive = recordName.isin(actives['name']).iloc[0]
+        recordValue = entry.value
+        recordName, recordPid = entry.holders[0]
+        recordActive = recordPid in active_pids
         
         embed.add_field(
             name = f"## Current { stat.title() } Record Holder ##",
-            value = f" **{ link_player(recordName, recordPid) }**{ '*' if recordActive else ''} with **{ recordValue }** { stat.title() }!",
+            value = f" **{ ', '.join(link_player(n, p) for n, p in entry.holders) }**{ '*' if recordActive else ''} with **{ recordValue }** { stat.title() }!",
             inline = False
           )
         
         embed.set_footer(text = "* means the record setter is still active.")
         
-        data = dataFilter.loc[
-          (dataFilter['name'].isin(actives['name'])) & 
-          ((dataFilter[stat] > 0.90*recordValue) & (dataFilter[stat] < recordValue))
-        ].sort_values(stat, ascending = False)
-        
         lines = []
         
-        for index, row in data.iterrows():
-          value = row[stat]
-          player = row['name']
-          pid = row['pid']
-          
+        for player, pid, value in index.chasers(stat, leagueName, organization, active_pids):
           lines.append(
             f" { link_player(player, pid) } is { round(recordValue - value, 2) } away from the record!"
           )
@@ -230,15 +197,12 @@ class Milestones(commands.Cog): # create a class for our cog that inherits from
         """
         await interaction.response.defer()
         
-        actives = await getAPI("https://api.simulationsoccer.com/player/getAllPlayers", params = {"active": "true"})
-        
         stat, base = next(iter(MILESTONES.items()))
         
-        embed = await self.recordEmbed(actives, stat, league, team)
+        embed = await self.recordEmbed(stat, league, team)
         
         view = RecordView(
           self,
-          actives,
           league,
           team
         )
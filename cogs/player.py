@@ -4,25 +4,28 @@ from discord.ext import commands
 from discord import (app_commands, ButtonStyle,)
 import pandas as pd
 import typing
-import requests
-import json 
-from db_utils import *
+import logging
+import time
+from db_utils import user_db
 from dotenv import load_dotenv
 import os
 
 from player_views import PlayerStatsView
+from api_client import get_client
 
 from utils import (
+  getAPI,
   get_team_logo_path,
   GK_STAT_GROUPS,
   OUT_STAT_GROUPS,
   PLAYER_DATA_GROUPS,
-  CURRENT_SEASON,
 )
 
 load_dotenv(".secrets/.env")
 # TEST_ID = int(os.getenv("DISCORD_TEST_ID"))
 
+logger = logging.getLogger(__name__)
+
 class Player(commands.Cog): # create a class for our cog that inherits from commands.Cog
     # this class is used to create a cog, which is a module that can be added to the bot
 
@@ -79,51 +82,39 @@ class Player(commands.Cog): # create a class for our cog that inherits from comm
     # @app_commands.guilds(discord.Object(id=TEST_ID))
     async def player(self, interaction: discord.Interaction, *, name: typing.Optional[str] = None):
         if name is None:
-          name = get_name(interaction.user.id)
+          name = await user_db.get_player_name(interaction.user.id)
         if name is None:  
           await interaction.response.send_message("You have no user stored. Use /store to store your forum username.")  
-        else:
-          # Gets player information
-          portalReq = requests.get('https://api.simulationsoccer.com/player/getPlayer?name=' + name.replace(" ", "%20"))
-          # Data formatting
-          portalData = pd.DataFrame(json.loads(portalReq.content))
-          
-          if portalData.iloc[0]['pos_gk'] == 20:
-            careerReq = requests.get('https://api.simulationsoccer.com/index/careerKeeper?name=' + name.replace(" ", "%20"))  
-          else:
-            careerReq = requests.get('https://api.simulationsoccer.com/index/careerOutfield?name=' + name.replace(" ", "%20"))
-          
-          careerData = pd.DataFrame(json.loads(careerReq.content))
-          
-          aggregateReq = requests.get('https://api.simulationsoccer.com/index/playerAggregate?name=' + name.replace(" ", "%20"))  
-          
-          aggregateData = pd.DataFrame(json.loads(aggregateReq.content))
-          
-          embed, file = self.playerStatsEmbed(portalData, None)
-          
-          view = PlayerStatsView(
-              self,
-              portalData = portalData,
-              aggregateData = aggregateData,
-              careerData = careerData
-          )
-          
-          await interaction.response.send_message(embed = embed, file = file, view = view)
+          return
+
+        await interaction.response.defer()  # Defer immediately to avoid timeout
+
+        # Aggregate and career data are loaded by the view when their tab is opened
+        started = time.perf_counter()
+        portalData = await getAPI('https://api.simulationsoccer.com/player/getPlayer', params = {"name": name})
+        logger.info(f"player {name}: portal fetched in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+        if portalData is None or portalData.empty:
+          await interaction.followup.send("Could not find a player with that name. Check the spelling.")
+          return
+
+        embed, file = self.playerStatsEmbed(portalData, None)
+
+        view = PlayerStatsView(self, portalData = portalData)
+
+        await interaction.followup.send(embed = embed, file = file, view = view)
 
         
     @app_commands.command(name='bank', description='Gets player bank information')
     async def bank(self, interaction: discord.Interaction, name: typing.Optional[str] = None):
         if name is None:
-          name = get_name(interaction.user.id)
+          name = await user_db.get_player_name(interaction.user.id)
         if name is None:  
           await interaction.response.send_message("You have no user stored. Use /store to store your forum username.")  
         else:
-          balance = requests.get('https://api.simulationsoccer.com/bank/getBankBalance?name=' + name.replace(" ", "%20"))
-          transactions = requests.get('https://api.simulationsoccer.com/bank/getBankHistory?name=' + name.replace(" ", "%20"))
-          # Data formatting
-          balancedata = pd.DataFrame(json.loads(balance.content))
-          transactiondata = pd.DataFrame(json.loads(transactions.content))
-          if transactiondata.empty:
+          balancedata = await getAPI('https://api.simulationsoccer.com/bank/getBankBalance', params = {"name": name})
+          transactiondata = await getAPI('https://api.simulationsoccer.com/bank/getBankHistory', params = {"name": name})
+          if transactiondata is None or transactiondata.empty:
             await interaction.response.send_message("This player does not have any bank information. Check the spelling.")
           else: 
             embed = discord.Embed(color = discord.Color(0xBD9523))
@@ -142,14 +133,12 @@ class Player(commands.Cog): # create a class for our cog that inherits from comm
     @app_commands.command(name='checklist', description='Returns the weekly TPE checklist')
     async def checklist(self, interaction: discord.Interaction, username: typing.Optional[str] = None):
         if username is None:
-          username = get_username(interaction.user.id)
+          username = await user_db.get_username(interaction.user.id)
         if username is None:  
           await interaction.response.send_message("You have no user stored. Use /store to store your forum username.")  
         else:
-          checklist = requests.get('https://api.simulationsoccer.com/player/tpeChecklist?username=' + username.replace(" ", "%20"))
-          # Data formatting
-          checklistdata = pd.DataFrame(json.loads(checklist.content))
-          if checklistdata.empty:
+          checklistdata = await getAPI('https://api.simulationsoccer.com/player/tpeChecklist', params = {"username": username})
+          if checklistdata is None or checklistdata.empty:
             await interaction.response.send_message("This player does not have any checklist information. Check the spelling.")
           else: 
             # Group the data based on the 'posted' status
@@ -171,13 +160,12 @@ class Player(commands.Cog): # create a class for our cog that inherits from comm
         await interaction.response.defer()  # Defer immediately to avoid timeout
         try:
             if username is None:
-                username = get_username(interaction.user.id)
+                username = await user_db.get_username(interaction.user.id)
             if username is None:
                 await interaction.followup.send("You have no user stored. Use /store to store your forum username.")
                 return
-            checklist = requests.get('https://api.simulationsoccer.com/player/teamTPEChecklist?username=' + username.replace(" ", "%20"))
-            checklist.raise_for_status()  # Raise error for bad HTTP status
-            checklistdata = pd.DataFrame(json.loads(checklist.content))
+            checklistdata = await get_client().get_json('https://api.simulationsoccer.com/player/teamTPEChecklist', params = {"username": username})
+            checklistdata = pd.DataFrame(checklistdata)
             if checklistdata.empty:
                 await interaction.followup.send("This user is not part of a team. Check the spelling.")
                 return
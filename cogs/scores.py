@@ -1,15 +1,15 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import requests
-import datetime
-from PIL import Image, ImageDraw, ImageFont
 import io
-import urllib.parse
 from dotenv import load_dotenv
 import os
 import sys
 import re
+import logging
+import asyncio
+import time
+from collections import OrderedDict
 
 # Fix import path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -21,19 +21,22 @@ TEST_ID = int(os.getenv("DISCORD_TEST_ID", 0))
 from utils import (
     SCORESAPIBASEURL,
     BOXSCOREAPIBASEURL,
-    CURRENT_SEASON,
-    DEFAULT_FONT_PATH,
     TEAM_ABBREVIATIONS,
-    DEFAULT_PRIMARY_COLOR,
-    get_team_logo_path,
     get_team_colors_from_api
 )
+from api_client import get_client
+from season_provider import season_provider, SEASON_UNAVAILABLE_MESSAGE
+from schedule_index import ScheduleIndex
+from matchup_image import create_matchup_image
+from render_pool import render_executor
 
-DATE_FORMAT_STR = "%Y-%m-%d"
+logger = logging.getLogger(__name__)
 
 FILENAME_NEXT_MATCH_IMAGE = "next_match.png"
 FILENAME_LAST_MATCH_IMAGE = "last_match.png"
-DEFAULT_SCORE_COLOR = (7, 11, 81, 255)
+BOXSCORE_CONCURRENCY = int(os.getenv("SSL_BOXSCORE_CONCURRENCY", 4))
+# Finished seasons whose schedule index is kept, besides the current one
+SCHEDULE_HISTORY = int(os.getenv("SSL_SCHEDULE_HISTORY", 4))
 
 ALL_TEAMS = set(TEAM_ABBREVIATIONS.values())
 
@@ -111,29 +114,24 @@ def resolve_team(name: str):
     return None
 
 
-def parse_date(date_str):
-    try:
-        return datetime.datetime.strptime(date_str, DATE_FORMAT_STR).date()
-    except Exception:
-        return None
-
-
-def get_api_data(season):
-    url = f"{SCORESAPIBASEURL}?season={season}&league=ALL"
-    r = requests.get(url, timeout=10)
-    r.raise_for_status()
-    return r.json()
+async def get_api_data(season):
+    return await get_client().get_json(
+        SCORESAPIBASEURL,
+        params={"season": season, "league": "ALL"}
+    )
 
 
-def get_boxscore(season, league_id, matchday, team):
+async def get_boxscore(season, league_id, matchday, team):
     try:
-        team = urllib.parse.quote(team)
-        url = f"{BOXSCOREAPIBASEURL}?season={season}&league={league_id}&matchday={matchday}&team={team}"
-
-        r = requests.get(url, timeout=10)
-        r.raise_for_status()
-
-        data = r.json()
+        data = await get_client().get_json(
+            BOXSCOREAPIBASEURL,
+            params={
+                "season": season,
+                "league": league_id,
+                "matchday": str(matchday),
+                "team": team,
+            }
+        )
 
         if isinstance(data, list) and len(data) > 0:
             return data[0]
@@ -146,175 +144,17 @@ def get_boxscore(season, league_id, matchday, team):
         return None
 
 
-def create_linear_gradient(width, height, start_color, end_color):
-    image = Image.new("RGBA", (width, height))
-    pixels = image.load()
-
-    for x in range(width):
-        ratio = x / width
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-        a = int(start_color[3] + (end_color[3] - start_color[3]) * ratio)
-
-        for y in range(height):
-            pixels[x, y] = (r, g, b, a)
-
-    return image
-
-
-def create_matchup_image(team1, score1, team2, score2, team_colors):
+async def render_matchup_image(home, home_score, away, away_score, team_colors):
+    # Only the two teams' colors are sent, so the cache key covers just this match
+    colors = {t: team_colors[t] for t in (home, away) if t in team_colors}
     try:
-        # -------- CONFIG -------- #
-        width, height = 1200, 320
-        bottom_bar_height = 70
-        logo_size = 150
-
-        # -------- COLOR HELPERS -------- #
-        def get_color(team, key, fallback):
-            return team_colors.get(team, {}).get(key, fallback)
-
-        def luminance(color):
-            r, g, b = color[:3]
-            return 0.299*r + 0.587*g + 0.114*b
-
-        def is_white(color):
-            r, g, b = color[:3]
-            return r > 240 and g > 240 and b > 240
-
-        def is_black(color):
-            r, g, b = color[:3]
-            return r < 20 and g < 20 and b < 20
-
-        def get_bar_text_color(bg_color, alternate_color):
-            # White background -> use alternate team color
-            if is_white(bg_color):
-                return alternate_color[:3]
-
-            # Black background -> use alternate team color
-            if is_black(bg_color):
-                return alternate_color[:3]
-
-            # Very light background -> black text
-            if luminance(bg_color) > 160:
-                return (0, 0, 0)
-
-            # Everything else -> white text
-            return (255, 255, 255)
-
-        left_primary = get_color(team1, "primary", DEFAULT_PRIMARY_COLOR)
-        left_secondary = get_color(team1, "secondary", left_primary)
-
-        right_primary = get_color(team2, "primary", DEFAULT_PRIMARY_COLOR)
-        right_secondary = get_color(team2, "secondary", right_primary)
-
-        img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-
-        
-        # -------- SMART GRADIENT DIRECTION -------- #
-
-        
-        left_start, left_end = left_primary, (255, 255, 255, 255)
-        right_start, right_end = (255, 255, 255, 255), right_primary
-
-        
-        left_half = create_linear_gradient(
-        width // 2, height - bottom_bar_height,
-        left_start, left_end
+        image = await render_executor.render_cached(
+            create_matchup_image, home, home_score, away, away_score, colors
         )
-
-        right_half = create_linear_gradient(
-        width - width // 2, height - bottom_bar_height,
-        right_start, right_end
-        )
-
-        img.paste(left_half, (0, 0))
-        img.paste(right_half, (width // 2, 0))
-
-        draw = ImageDraw.Draw(img)
-
-        # -------- LOGOS -------- #
-        logo1 = Image.open(get_team_logo_path(team1)).convert("RGBA").resize((logo_size, logo_size))
-        logo2 = Image.open(get_team_logo_path(team2)).convert("RGBA").resize((logo_size, logo_size))
-
-        logo_y = (height - bottom_bar_height) // 2 - logo_size // 2
-
-        img.paste(logo1, (int(width * 0.25 - logo_size / 2), logo_y), logo1)
-        img.paste(logo2, (int(width * 0.75 - logo_size / 2), logo_y), logo2)
-
-        draw.rectangle((0, height - bottom_bar_height, width // 2, height), fill=left_primary)
-        draw.rectangle((width // 2, height - bottom_bar_height, width, height), fill=right_secondary)
-
-        # -------- TEXT COLORS -------- #
-        left_text_color = get_bar_text_color(
-            left_primary,
-            left_secondary
-        )
-        
-        right_text_color = get_bar_text_color(
-            right_secondary,
-            right_primary
-        )   
-
-        
-        try:
-            font_score = ImageFont.truetype(DEFAULT_FONT_PATH, 110)
-            font_small = ImageFont.truetype(DEFAULT_FONT_PATH, 40)
-        except:
-            font_score = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-
-        # -------- TEAM NAMES -------- #
-        draw.text(
-            (width // 4, height - bottom_bar_height // 2),
-            team1.upper(),
-            font=font_small,
-            fill=left_text_color,
-            anchor="mm"
-        )
-
-        draw.text(
-            (3 * width // 4, height - bottom_bar_height // 2),
-            team2.upper(),
-            font=font_small,
-            fill=right_text_color,
-            anchor="mm"
-        )
-
-        if score1 is not None:
-            draw.text(
-                (width // 2 - 80, (height - bottom_bar_height) // 2),
-                str(score1),
-                font=font_score,
-                fill=DEFAULT_SCORE_COLOR,
-                anchor="mm"
-            )
-
-            draw.text(
-                (width // 2 + 80, (height - bottom_bar_height) // 2),
-                str(score2),
-                font=font_score,
-                fill=DEFAULT_SCORE_COLOR,
-                anchor="mm"
-            )
-        else:
-            draw.text(
-                (width // 2, (height - bottom_bar_height) // 2),
-                "VS",
-                font=font_score,
-                fill=DEFAULT_SCORE_COLOR,
-                anchor="mm"
-            )
-
-
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        return buffer
-
     except Exception as e:
-        logger.error(f"Match image error: {e}")
+        logger.error(f"Match image render failed: {e}")
         return None
+    return io.BytesIO(image) if image else None
 
 # ---------------- MATCH DETAILS FORMAT ---------------- #
 
@@ -367,6 +207,25 @@ class Scores(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.team_colors = {} 
+        self.schedules = OrderedDict()  # season -> ScheduleIndex, least recently used first
+
+    async def get_schedule(self, season):
+        data = await get_api_data(season)
+        schedule = self.schedules.pop(str(season), None)
+        if schedule is None:
+            schedule = ScheduleIndex()
+        self.schedules[str(season)] = schedule
+        # Cheap when the payload came from the cache, incremental otherwise
+        schedule.update(data)
+        self.trim_schedules()
+        return schedule
+
+    def trim_schedules(self):
+        # The current season is always kept, finished ones up to SCHEDULE_HISTORY
+        current = str(season_provider.current)
+        finished = [season for season in self.schedules if season != current]
+        for season in finished[:max(0, len(finished) - SCHEDULE_HISTORY)]:
+            del self.schedules[season]
         
     async def ensure_team_colors(self):
         if not self.team_colors:
@@ -396,36 +255,33 @@ class Scores(commands.Cog):
     )
     
     # @app_commands.guilds(discord.Object(id=TEST_ID))
-    async def last_match(self, interaction: discord.Interaction, team: str, season: str = str(CURRENT_SEASON)):
+    async def last_match(self, interaction: discord.Interaction, team: str, season: str = None):
         await interaction.response.defer()
+        if season is None:
+            season = await season_provider.get()
+            if season is None:
+                return await interaction.followup.send(SEASON_UNAVAILABLE_MESSAGE)
         await self.ensure_team_colors()
         team_name = resolve_team(team)
         if not team_name:
             return await interaction.followup.send("No such team found.")
 
-        data = get_api_data(season)
-        matches = [
-            (parse_date(m.get("IRLDate")), m)
-            for m in data
-            if team_name in [m.get("Home"), m.get("Away")]
-            and m.get("HomeScore") is not None
-        ]
+        schedule = await self.get_schedule(season)
+        match = schedule.last_played(team_name)
 
-        if not matches:
+        if match is None:
             return await interaction.followup.send("No matches found.")
 
-        match = sorted(matches, key=lambda x: x[0], reverse=True)[0][1]
-
         league_id = get_league_id_from_match(match)
 
-        box = get_boxscore(season, league_id, match.get("MatchDay"), team_name)
+        box = await get_boxscore(season, league_id, match.get("MatchDay"), team_name)
         desc = format_match_details(match, box)
 
         embed = discord.Embed(title=f"Last Match details for {team_name}", description=desc)
 
-        image = create_matchup_image(match.get("Home"), match.get("HomeScore"),
-                                        match.get("Away"), match.get("AwayScore"),
-                                        self.team_colors)
+        image = await render_matchup_image(match.get("Home"), match.get("HomeScore"),
+                                           match.get("Away"), match.get("AwayScore"),
+                                           self.team_colors)
 
         if image:
             file = discord.File(image, filename=FILENAME_LAST_MATCH_IMAGE)
@@ -440,28 +296,23 @@ class Scores(commands.Cog):
     team="Team name or abbreviation"
     )
     # @app_commands.guilds(discord.Object(id=TEST_ID))
-    async def next_match(self, interaction: discord.Interaction, team: str, season: str = str(CURRENT_SEASON)):
+    async def next_match(self, interaction: discord.Interaction, team: str, season: str = None):
         await interaction.response.defer()
+        if season is None:
+            season = await season_provider.get()
+            if season is None:
+                return await interaction.followup.send(SEASON_UNAVAILABLE_MESSAGE)
         await self.ensure_team_colors()
         team_name = resolve_team(team)
         if not team_name:
             return await interaction.followup.send("Unknown team")
 
-        data = get_api_data(season)
-
-        matches = [
-            (parse_date(m.get("IRLDate")), m)
-            for m in data
-            if m.get("IRLDate")
-            and team_name in [m.get("Home"), m.get("Away")]
-            and m.get("HomeScore") is None
-        ]
+        schedule = await self.get_schedule(season)
+        match = schedule.next_unplayed(team_name)
 
-        if not matches:
+        if match is None:
             return await interaction.followup.send("No upcoming matches found.")
 
-        match = sorted(matches, key=lambda x: x[0])[0][1]
-
         league_name = get_league_display_name(match)
         matchday = match.get("MatchDay")
         matchday_str = ""
@@ -492,7 +343,7 @@ class Scores(commands.Cog):
 
         embed = discord.Embed(title=f"Next Match details for {team_name}", description=desc)
 
-        image = create_matchup_image(
+        image = await render_matchup_image(
             match.get("Home"), None,
             match.get("Away"), None,
             self.team_colors
@@ -543,14 +394,8 @@ class Scores(commands.Cog):
             if not team_name:
                 return await interaction.followup.send("Invalid team name.")
 
-        data = get_api_data(season)
-
-        matches = [
-            m for m in data
-            if str(m.get("MatchDay")).lower() == str(matchday).lower()
-            and m.get("MatchType") == league_id
-            and (team_name is None or team_name in [m.get("Home"), m.get("Away")])
-        ]
+        schedule = await self.get_schedule(season)
+        matches = schedule.matchday(league_id, matchday, team_name)
 
         if not matches:
             return await interaction.followup.send("No matches found.")
@@ -630,20 +475,50 @@ class Scores(commands.Cog):
                         f"{md}"
                     )
 
-        embeds = []
-        files = []
+        # ---- FETCH + RENDER ---- #
+        # Boxscores are fetched concurrently (bounded), and each image is
+        # rendered on the render pool as soon as its own data is in.
+        semaphore = asyncio.Semaphore(BOXSCORE_CONCURRENCY)
 
-        for i, match in enumerate(matches):
+        async def load_match(match):
             box = None
+            fetch_time = 0.0
 
             if match.get("HomeScore") is not None:
-                box = get_boxscore(
-                    season,
-                    league_id,
-                    match.get("MatchDay"),
-                    match.get("Home")
-                )
+                async with semaphore:
+                    fetch_start = time.perf_counter()
+                    box = await get_boxscore(
+                        season,
+                        league_id,
+                        match.get("MatchDay"),
+                        match.get("Home")
+                    )
+                    fetch_time = time.perf_counter() - fetch_start
+
+            render_start = time.perf_counter()
+            image = await render_matchup_image(
+                match.get("Home"), match.get("HomeScore"),
+                match.get("Away"), match.get("AwayScore"),
+                self.team_colors
+            )
+            render_time = time.perf_counter() - render_start
+
+            return box, image, fetch_time, render_time
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(load_match(m) for m in matches))
+        elapsed = time.perf_counter() - started
 
+        logger.info(
+            f"search_match S{season} {league_id} {matchday}: {len(matches)} matches in {elapsed * 1000:.0f} ms "
+            f"(boxscores {sum(r[2] for r in results) * 1000:.0f} ms, "
+            f"renders {sum(r[3] for r in results) * 1000:.0f} ms if run serially)"
+        )
+
+        embeds = []
+        files = []
+
+        for i, (match, (box, image, _, _)) in enumerate(zip(matches, results)):
             desc = format_match_details(match, box)
 
             embed = discord.Embed(
@@ -651,12 +526,6 @@ class Scores(commands.Cog):
                 description=desc
             )
 
-            image = create_matchup_image(
-                match.get("Home"), match.get("HomeScore"),
-                match.get("Away"), match.get("AwayScore"),
-                self.team_colors
-            )
-
             if image:
                 filename = f"match_{i}.png"
                 file = discord.File(image, filename=filename)
@@ -1,130 +1,217 @@
-import pandas as pd
+import os
+import asyncio
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-#### DATABASE FUNCTIONS ####
-## Creates a connection to the user/player name database
-def create_connection():
-    """ create a database connection to the SQLite database
-        specified by db_file
-    :param db_file: database file
-    :return: Connection object or None
-    """
-    conn = None
-    try:
-        conn = sqlite3.connect("database/discordBotUser.db")
-    except Exception as e:
-        print(e)
-
-    return conn
-
-def create_welcome_table(conn):
-    """Create the welcomeMessage table if it doesn't exist."""
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS welcomeMessage (
-                guildID INTEGER PRIMARY KEY,
-                active INTEGER NOT NULL
-            )
-        """)
-        conn.commit()
-    except Exception as e:
-        print("Error creating welcomeMessage table:", e)
-  
-## Adds a new user row to the database
-def add_row(conn, data):
-    """
-    Create a new row into the table
-    :param conn:
-    :param data:
-    :return: row id
+#### ASYNC DATABASE ACCESS ####
+## One long-lived connection used from a single dedicated thread, so lookups
+## never block the event loop and never pay for a connect/close. The SQL
+## strings are constants, so sqlite3 reuses their prepared statements.
+USER_DB_PATH = os.getenv("SSL_USER_DB", "database/discordBotUser.db")
+
+## Applied in order once at startup; PRAGMA user_version records progress
+MIGRATIONS = [
     """
-    sql = ''' INSERT INTO discordUser(discordID, username, player)
-              VALUES(?,?,?) '''
-    cur = conn.cursor()
-    cur.execute(sql, data)
-    conn.commit()
-    return cur.lastrowid
-
-## Updates a current user row to the database
-def update_row(conn, data):
+    CREATE TABLE IF NOT EXISTS discordUser (
+        discordID INTEGER,
+        username TEXT,
+        player TEXT
+    )
+    """,
     """
-    update priority, begin_date, and end date of a task
-    :param conn:
-    :param task:
-    :return: row id
+    CREATE TABLE IF NOT EXISTS welcomeMessage (
+        guildID INTEGER PRIMARY KEY,
+        active INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_discordUser_discordID ON discordUser (discordID)",
+    "CREATE INDEX IF NOT EXISTS idx_discordUser_username ON discordUser (username)",
+]
+
+## Legacy tables may hold discordID as text, so rows are matched on both
+## forms of the ID and normalized to int when read
+SELECT_USER_SQL = "SELECT discordID, username, player FROM discordUser WHERE discordID IN (?, ?)"
+SELECT_ALL_USERS_SQL = "SELECT discordID, username, player FROM discordUser"
+UPDATE_USER_SQL = "UPDATE discordUser SET username = ?, player = ? WHERE discordID IN (?, ?)"
+INSERT_USER_SQL = "INSERT INTO discordUser(discordID, username, player) VALUES(?,?,?)"
+SELECT_WELCOME_SQL = "SELECT active FROM welcomeMessage WHERE guildID = ?"
+UPSERT_WELCOME_SQL = """
+    INSERT INTO welcomeMessage (guildID, active)
+    VALUES (?, ?)
+    ON CONFLICT(guildID) DO UPDATE SET active=excluded.active
+"""
+
+
+@dataclass(frozen = True)
+class UserLink:
+    """A Discord account linked to a forum username and player."""
+    discord_id: int
+    username: str
+    player: str
+
+    @classmethod
+    def from_row(cls, row):
+        """UserLink for a (discordID, username, player) row, None if the
+        stored ID is not a number.
+        """
+        try:
+            return cls(int(row[0]), row[1], row[2])
+        except (TypeError, ValueError):
+            return None
+
+
+class UserDatabase:
+    """Async access to the bot database.
+
+    User links are also held in memory: every link is loaded on start and
+    store_user writes through to both the table and the cache, so lookups
+    by Discord ID or username never touch SQLite.
     """
-    sql = ''' UPDATE discordUser
-              SET discordID = ? ,
-                  username = ? ,
-                  player = ?
-              WHERE discordID = ?'''
-    cur = conn.cursor()
-    cur.execute(sql, data)
-    conn.commit()
-    return(cur.lastrowid)
-
-## Gets the current player name tied to a Discord User
-def get_name(discord_id):
-    session = create_connection()
-    with session:
-      table = pd.read_sql_query("SELECT * from discordUser WHERE discordID = " + str(discord_id), session)
-      if(table.shape[0] > 0):
-        name = table["player"][0]
-      else:
-        name = None
-    session.close()
-    
-    return(name)
-
-
-## Gets the current player name tied to a Discord User
-def get_username(discord_id):
-    session = create_connection()
-    with session:
-      table = pd.read_sql_query("SELECT * from discordUser WHERE discordID = " + str(discord_id), session)
-      if(table.shape[0] > 0):
-        name = table["username"][0]
-      else:
-        name = None
-    session.close()
-    
-    return(name)
-
-def get_discord_id(username):
-    session = create_connection()
-    with session:
-        table = pd.read_sql_query("SELECT * from discordUser WHERE username = " + str(username), session)
-        if(table.shape[0] > 0):
-            id = table["discordID"][0]
-        else:
-            id = None
-    session.close()
-    return(id)
-  
-# Helper functions for toggle
-def get_welcome_status(guild_id: int) -> bool:
-    conn = create_connection()
-    
-    create_welcome_table(conn)
-    
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT active FROM welcomeMessage WHERE guildID = ?", (guild_id,))
-        row = cursor.fetchone()
+    def __init__(self, path = USER_DB_PATH):
+        self.path = path
+        self._conn = None
+        self._executor = None
+        self._links = None         # discordID -> UserLink
+        self._by_username = {}     # username -> discordID
+
+    async def start(self):
+        """Opens the connection, applies pending migrations and loads user links."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "sqlite")
+        await self._run(self._open)
+        if self._links is None:
+            self._load_links(await self._run(self._fetch_all_users))
+
+    def _load_links(self, links):
+        by_id, by_username = {}, {}
+        for link in links:
+            # Like the old queries, the first row wins if a user was stored twice
+            by_id.setdefault(link.discord_id, link)
+            by_username.setdefault(link.username, link.discord_id)
+        self._links, self._by_username = by_id, by_username
+
+    def _cache_link(self, link):
+        old = self._links.get(link.discord_id)
+        if old is not None and self._by_username.get(old.username) == old.discord_id:
+            del self._by_username[old.username]
+        self._links[link.discord_id] = link
+        self._by_username[link.username] = link.discord_id
+
+    async def close(self):
+        if self._executor is None:
+            return
+        await self._run(self._close)
+        self._executor.shutdown(wait = True)
+        self._executor = None
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            await self.start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    ## Everything below runs on the database thread
+    def _open(self):
+        if self._conn is not None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread = False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        with self._conn:
+            for number, statement in enumerate(MIGRATIONS[version:], start = version + 1):
+                self._conn.execute(statement)
+                self._conn.execute(f"PRAGMA user_version = {number}")
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _fetch_user(self, discord_id):
+        row = self._conn.execute(SELECT_USER_SQL, (discord_id, str(discord_id))).fetchone()
+        return UserLink.from_row(row) if row else None
+
+    def _fetch_all_users(self):
+        links = (UserLink.from_row(row) for row in self._conn.execute(SELECT_ALL_USERS_SQL))
+        return [link for link in links if link is not None]
+
+    def _upsert_user(self, link):
+        with self._conn:
+            old = self._fetch_user(link.discord_id)
+            if old is not None:
+                self._conn.execute(
+                    UPDATE_USER_SQL,
+                    (link.username, link.player, link.discord_id, str(link.discord_id)),
+                )
+            else:
+                self._conn.execute(INSERT_USER_SQL, (link.discord_id, link.username, link.player))
+        return old
+
+    def _fetch_welcome_status(self, guild_id):
+        row = self._conn.execute(SELECT_WELCOME_SQL, (guild_id,)).fetchone()
         return bool(row[0]) if row else False  # default to False if not set
 
-def set_welcome_status(guild_id: int, enabled: bool):
-    conn = create_connection()
-    
-    create_welcome_table(conn)
-    
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO welcomeMessage (guildID, active)
-            VALUES (?, ?)
-            ON CONFLICT(guildID) DO UPDATE SET active=excluded.active
-        """, (guild_id, int(enabled)))
-        conn.commit()
+    def _store_welcome_status(self, guild_id, enabled):
+        with self._conn:
+            self._conn.execute(UPSERT_WELCOME_SQL, (guild_id, int(enabled)))
+
+    ## Async API
+    async def get_user(self, discord_id):
+        """Returns the UserLink stored for a Discord ID, or None."""
+        if self._links is None:
+            await self.start()
+        return self._links.get(int(discord_id))
+
+    async def get_user_by_username(self, username):
+        """Returns the UserLink stored for a forum username, or None."""
+        if self._links is None:
+            await self.start()
+        discord_id = self._by_username.get(str(username))
+        return self._links.get(discord_id) if discord_id is not None else None
+
+    async def get_discord_id(self, username):
+        """Discord ID tied to a forum username, or None."""
+        link = await self.get_user_by_username(username)
+        return link.discord_id if link else None
+
+    async def get_player_name(self, discord_id):
+        """Player name tied to a Discord user, or None."""
+        link = await self.get_user(discord_id)
+        return link.player if link else None
+
+    async def get_username(self, discord_id):
+        """Forum username tied to a Discord user, or None."""
+        link = await self.get_user(discord_id)
+        return link.username if link else None
+
+    async def all_users(self):
+        return await self._run(self._fetch_all_users)
+
+    async def store_user(self, discord_id, username, player):
+        """Links a Discord ID to a username and player.
+
+        :return: the previous UserLink, or None if the user was new
+        """
+        link = UserLink(int(discord_id), username, player)
+        if self._links is None:
+            await self.start()
+        old = await self._run(self._upsert_user, link)
+        # Only cached once the row is committed
+        self._cache_link(link)
+        return old
+
+    async def get_welcome_status(self, guild_id: int) -> bool:
+        return await self._run(self._fetch_welcome_status, guild_id)
+
+    async def set_welcome_status(self, guild_id: int, enabled: bool):
+        await self._run(self._store_welcome_status, guild_id, enabled)
+
 
+user_db = UserDatabase()
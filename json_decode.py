@@ -0,0 +1,82 @@
+import os
+import json
+import asyncio
+import pandas as pd
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:  # Optional, noticeably faster on the large tables
+    orjson = None
+
+load_dotenv(".secrets/.env")
+
+#### JSON DECODING ####
+## API bodies are parsed with orjson when it is installed, and bodies over
+## SSL_JSON_THREAD_BYTES are parsed on a worker thread so a large career or
+## schedule payload does not stall the event loop. Tables are built column
+## by column and the intermediate records are dropped as soon as the
+## DataFrame exists.
+##
+## This is not a streaming parse: the whole body is read first and then
+## decoded in one go, so peak memory still holds the body plus the parsed
+## records (only records_to_frame releases records as it goes). Neither
+## json nor orjson can parse incrementally, and streaming from
+## resp.content would need another dependency.
+JSON_THREAD_BYTES = int(os.getenv("SSL_JSON_THREAD_BYTES", 256 * 1024))
+
+
+def loads(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def records_to_frame(data):
+    """Builds a DataFrame from a JSON list of objects (or a single object).
+
+    Equivalent to pd.DataFrame(records), but filled column-wise while the
+    records are consumed: each record is dropped from the list once its
+    values are appended, so the list of dicts and the columns are never
+    both fully alive. The list passed in is emptied.
+    """
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list):
+        raise TypeError(f"unexpected JSON type {type(data)}")
+
+    rows = len(data)
+    columns = {}
+    keys = None
+    data.reverse()  # pop() from the end is O(1)
+    for i in range(rows):
+        record = data.pop()
+        if keys is not None and record.keys() == keys:
+            # Same fields as the previous record, the usual case
+            for name, column in columns.items():
+                column.append(record[name])
+            continue
+
+        for name, value in record.items():
+            column = columns.get(name)
+            if column is None:
+                # Column first seen on a later record: earlier rows are missing
+                column = columns[name] = [None] * i
+            column.append(value)
+        for column in columns.values():
+            if len(column) <= i:
+                column.append(None)
+        keys = record.keys() if len(record) == len(columns) else None
+
+    return pd.DataFrame(columns, index = pd.RangeIndex(rows))
+
+
+def decode_frame(body):
+    return records_to_frame(loads(body))
+
+
+async def decode(body, decoder = loads):
+    """Runs decoder(body), on a worker thread if the body is large."""
+    if len(body) >= JSON_THREAD_BYTES:
+        return await asyncio.to_thread(decoder, body)
+    return decoder(body)
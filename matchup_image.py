@@ -0,0 +1,175 @@
+from PIL import Image, ImageDraw, ImageFont
+import io
+import logging
+
+from utils import (
+    DEFAULT_FONT_PATH,
+    DEFAULT_PRIMARY_COLOR,
+    get_team_logo_path,
+)
+from gradients import linear_gradient, HORIZONTAL
+from assets import get_image, get_font
+
+logger = logging.getLogger(__name__)
+
+#### MATCHUP IMAGES ####
+## Team-vs-team banner used by the scores commands. Runs in a render worker
+## process, so it takes plain data and returns PNG bytes.
+DEFAULT_SCORE_COLOR = (7, 11, 81, 255)
+
+
+def create_linear_gradient(width, height, start_color, end_color):
+    return linear_gradient((width, height), start_color, end_color, HORIZONTAL)
+
+
+def create_matchup_image(team1, score1, team2, score2, team_colors):
+    try:
+        # -------- CONFIG -------- #
+        width, height = 1200, 320
+        bottom_bar_height = 70
+        logo_size = 150
+
+        # -------- COLOR HELPERS -------- #
+        def get_color(team, key, fallback):
+            return team_colors.get(team, {}).get(key, fallback)
+
+        def luminance(color):
+            r, g, b = color[:3]
+            return 0.299*r + 0.587*g + 0.114*b
+
+        def is_white(color):
+            r, g, b = color[:3]
+            return r > 240 and g > 240 and b > 240
+
+        def is_black(color):
+            r, g, b = color[:3]
+            return r < 20 and g < 20 and b < 20
+
+        def get_bar_text_color(bg_color, alternate_color):
+            # White background -> use alternate team color
+            if is_white(bg_color):
+                return alternate_color[:3]
+
+            # Black background -> use alternate team color
+            if is_black(bg_color):
+                return alternate_color[:3]
+
+            # Very light background -> black text
+            if luminance(bg_color) > 160:
+                return (0, 0, 0)
+
+            # Everything else -> white text
+            return (255, 255, 255)
+
+        left_primary = get_color(team1, "primary", DEFAULT_PRIMARY_COLOR)
+        left_secondary = get_color(team1, "secondary", left_primary)
+
+        right_primary = get_color(team2, "primary", DEFAULT_PRIMARY_COLOR)
+        right_secondary = get_color(team2, "secondary", right_primary)
+
+        img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+        
+        # -------- SMART GRADIENT DIRECTION -------- #
+
+        
+        left_start, left_end = left_primary, (255, 255, 255, 255)
+        right_start, right_end = (255, 255, 255, 255), right_primary
+
+        
+        left_half = create_linear_gradient(
+        width // 2, height - bottom_bar_height,
+        left_start, left_end
+        )
+
+        right_half = create_linear_gradient(
+        width - width // 2, height - bottom_bar_height,
+        right_start, right_end
+        )
+
+        img.paste(left_half, (0, 0))
+        img.paste(right_half, (width // 2, 0))
+
+        draw = ImageDraw.Draw(img)
+
+        # -------- LOGOS -------- #
+        logo1 = get_image(get_team_logo_path(team1), (logo_size, logo_size))
+        logo2 = get_image(get_team_logo_path(team2), (logo_size, logo_size))
+
+        logo_y = (height - bottom_bar_height) // 2 - logo_size // 2
+
+        img.paste(logo1, (int(width * 0.25 - logo_size / 2), logo_y), logo1)
+        img.paste(logo2, (int(width * 0.75 - logo_size / 2), logo_y), logo2)
+
+        draw.rectangle((0, height - bottom_bar_height, width // 2, height), fill=left_primary)
+        draw.rectangle((width // 2, height - bottom_bar_height, width, height), fill=right_secondary)
+
+        # -------- TEXT COLORS -------- #
+        left_text_color = get_bar_text_color(
+            left_primary,
+            left_secondary
+        )
+        
+        right_text_color = get_bar_text_color(
+            right_secondary,
+            right_primary
+        )   
+
+        
+        try:
+            font_score = get_font(DEFAULT_FONT_PATH, 110)
+            font_small = get_font(DEFAULT_FONT_PATH, 40)
+        except:
+            font_score = ImageFont.load_default()
+            font_small = ImageFont.load_default()
+
+        # -------- TEAM NAMES -------- #
+        draw.text(
+            (width // 4, height - bottom_bar_height // 2),
+            team1.upper(),
+            font=font_small,
+            fill=left_text_color,
+            anchor="mm"
+        )
+
+        draw.text(
+            (3 * width // 4, height - bottom_bar_height // 2),
+            team2.upper(),
+            font=font_small,
+            fill=right_text_color,
+            anchor="mm"
+        )
+
+        if score1 is not None:
+            draw.text(
+                (width // 2 - 80, (height - bottom_bar_height) // 2),
+                str(score1),
+                font=font_score,
+                fill=DEFAULT_SCORE_COLOR,
+                anchor="mm"
+            )
+
+            draw.text(
+                (width // 2 + 80, (height - bottom_bar_height) // 2),
+                str(score2),
+                font=font_score,
+                fill=DEFAULT_SCORE_COLOR,
+                anchor="mm"
+            )
+        else:
+            draw.text(
+                (width // 2, (height - bottom_bar_height) // 2),
+                "VS",
+                font=font_score,
+                fill=DEFAULT_SCORE_COLOR,
+                anchor="mm"
+            )
+
+
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    except Exception as e:
+        logger.error(f"Match image error: {e}")
+        return None
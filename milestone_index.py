@@ -0,0 +1,63 @@
+import numpy as np
+
+from utils import MILESTONES
+from table_schema import exact_values
+
+#### MILESTONE PROXIMITY INDEX ####
+## For every milestone stat in a career table, the players that are close
+## to each milestone, computed once per table load with NumPy instead of
+## walking the rows per command.
+
+
+def milestone_window(milestone):
+    # Close means within 5% or within 5, whichever is wider
+    return min(milestone * 0.95, (milestone - 5))
+
+
+class MilestoneIndex:
+    """Players close to a milestone, keyed by (stat, league, milestone).
+
+    Built from one career table: league is None when the table was not
+    requested split per league (by_league False). Each entry lists (name, pid, value) of every player,
+    active or not, highest value first.
+    """
+
+    def __init__(self, data, by_league = False, by_club = None):
+        self._entries = {}
+
+        stats = [stat for stat in MILESTONES if stat in data.columns]
+        # Grouped by how the table was requested, not by which columns it has
+        if by_league and 'league' in data.columns:
+            leagues = data['league'].to_numpy()
+            groups = [(league, leagues == league) for league in data['league'].dropna().unique()]
+        else:
+            groups = [(None, np.ones(len(data), dtype = bool))]
+
+        names = data['name'].to_numpy()
+        pids = data['pid'].to_numpy()
+
+        for stat in stats:
+            base = MILESTONES[stat]
+            values = exact_values(data[stat])
+            numeric = values.astype(float)
+            # Highest first; ties keep table order
+            order = np.argsort(-numeric, kind = "stable")
+            candidate = numeric > 0.95*base[0]
+
+            for m in base:
+                close = candidate & (numeric < m) & (numeric >= milestone_window(m))
+                for league, in_league in groups:
+                    rows = order[(close & in_league)[order]]
+                    self._entries[(stat, league, m)] = list(
+                        zip(names[rows].tolist(), pids[rows].tolist(), values[rows])
+                    )
+
+    def chasers(self, stat, league, milestone, active_pids = None):
+        """(name, pid, value) of players close to milestone, highest first.
+
+        :param active_pids: if given, only players whose pid is in it
+        """
+        entries = self._entries.get((stat, league, milestone), [])
+        if active_pids is None:
+            return entries
+        return [entry for entry in entries if entry[1] in active_pids]
@@ -4,7 +4,6 @@ import discord
 import pandas as pd
 
 from utils import (
-  CURRENT_SEASON,
   MILESTONES,
 )
 
@@ -34,7 +33,6 @@ class MilestoneSelect(discord.ui.Select):
     base = MILESTONES[value]
     
     embed = await self.ancestor.cog.milestoneEmbed(
-      self.ancestor.actives, 
       value, 
       base, 
       self.ancestor.league
@@ -57,10 +55,9 @@ class MilestoneSelect(discord.ui.Select):
 
 
 class MilestoneView(View):
-  def __init__(self, cog, actives, league):
+  def __init__(self, cog, league):
     super().__init__(timeout = 60)
     self.cog = cog
-    self.actives = actives
     self.league = league
     
     self.add_item(MilestoneSelect(self))
@@ -103,7 +100,6 @@ class RecordSelect(discord.ui.Select):
     value = self.values[0]
     
     embed = await self.ancestor.cog.recordEmbed(
-      self.ancestor.actives, 
       value, 
       self.ancestor.league,
       self.ancestor.org
@@ -125,10 +121,9 @@ class RecordSelect(discord.ui.Select):
         )
 
 class RecordView(View):
-  def __init__(self, cog, actives, league, org):
+  def __init__(self, cog, league, org):
     super().__init__(timeout = 60) # Time out after 1 minute
     self.cog = cog
-    self.actives = actives
     self.league = league
     self.org = org
 
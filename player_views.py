@@ -1,55 +1,136 @@
 from discord.ui import View, button
 from discord import ButtonStyle
 import discord
+import logging
+import time
 import pandas as pd
 
-from utils import (
-  CURRENT_SEASON,
-)
+from season_provider import current_season, season_provider, SEASON_UNAVAILABLE_MESSAGE
+from utils import getAPI
+from table_schema import PLAYER_STATS_SCHEMA
+
+AGGREGATEAPIURL = 'https://api.simulationsoccer.com/index/playerAggregate'
+CAREERKEEPERAPIURL = 'https://api.simulationsoccer.com/index/careerKeeper'
+CAREEROUTFIELDAPIURL = 'https://api.simulationsoccer.com/index/careerOutfield'
+
+logger = logging.getLogger(__name__)
 
 class PlayerStatsView(View):
-    def __init__(self, cog, portalData, aggregateData, careerData):
+    """Player Info / Season Stats / Career Totals tabs for /player.
+
+    Only the portal data is needed up front. The aggregate and career data
+    are fetched the first time their tab is opened and kept on the view;
+    other views for the same player share them through the API client's
+    response cache.
+    """
+    def __init__(self, cog, portalData, aggregateData = None, careerData = None):
         super().__init__(timeout = 300) # Time out after 5 minutes
         self.cog = cog
         self.portalData = portalData
         self.aggregateData = aggregateData
         self.careerData = careerData
-        
+        self.name = portalData.iloc[0]['name']
+        # Read when the view is built so the label follows season rollovers;
+        # resolved again by load_aggregate if it was not known yet
+        self.season = current_season()
+        self.set_season_label()
+
         self.children[0].disabled = True
-        
-        playerExistCurrent = CURRENT_SEASON in self.aggregateData['season'].values
-        if not playerExistCurrent:
+
+        if self.season is not None and self.aggregateData is not None and not self.has_current_season():
           # Removes the Current Season stats button if there is no data there
-          self.remove_item(self.children[1])
+          self.remove_item(self.season_stats)
 
-    @button(label="Player Info", style=ButtonStyle.success)
-    async def player_info(self, interaction: discord.Interaction, button):
+    def set_season_label(self):
+        self.season_stats.label = f"S{self.season} Stats" if self.season is not None else "Season Stats"
+
+    def has_current_season(self):
+        return (
+          self.aggregateData is not None
+          and not self.aggregateData.empty
+          and self.season in self.aggregateData['season'].values
+        )
+
+    async def load_aggregate(self):
+        if self.season is None:
+          self.season = await season_provider.get()
+          self.set_season_label()
+        if self.aggregateData is None:
+          started = time.perf_counter()
+          data = await getAPI(AGGREGATEAPIURL, params = {"name": self.name})
+          logger.info(f"player {self.name}: aggregate fetched in {(time.perf_counter() - started) * 1000:.0f} ms")
+          self.aggregateData = PLAYER_STATS_SCHEMA.apply(data) if data is not None else None
+        return self.aggregateData
+
+    async def load_career(self):
+        if self.careerData is None:
+          if self.portalData.iloc[0]['pos_gk'] == 20:
+            url = CAREERKEEPERAPIURL
+          else:
+            url = CAREEROUTFIELDAPIURL
+          started = time.perf_counter()
+          data = await getAPI(url, params = {"name": self.name})
+          logger.info(f"player {self.name}: career fetched in {(time.perf_counter() - started) * 1000:.0f} ms")
+          self.careerData = PLAYER_STATS_SCHEMA.apply(data) if data is not None else None
+        return self.careerData
+
+    def select(self, button):
         for child in self.children:
           child.disabled = False
         button.disabled = True
-        
-        embed, file = self.cog.playerStatsEmbed(self.portalData, None)
-        
-        await interaction.response.edit_message(embed = embed, attachments = [file], view = self)
 
-    @button(label=f"S{CURRENT_SEASON} Stats", style=ButtonStyle.success)
+    async def show(self, interaction: discord.Interaction, stats):
+        embed, file = self.cog.playerStatsEmbed(self.portalData, stats)
+        if interaction.response.is_done():
+          await interaction.edit_original_response(embed = embed, attachments = [file], view = self)
+        else:
+          await interaction.response.edit_message(embed = embed, attachments = [file], view = self)
+
+    @button(label="Player Info", style=ButtonStyle.success)
+    async def player_info(self, interaction: discord.Interaction, button):
+        self.select(button)
+        await self.show(interaction, None)
+
+    @button(label="Season Stats", style=ButtonStyle.success)
     async def season_stats(self, interaction: discord.Interaction, button):
-        for child in self.children:
-          child.disabled = False
-        button.disabled = True
-        
-        season_df = self.aggregateData[self.aggregateData["season"] == CURRENT_SEASON]
-        
-        embed, file = self.cog.playerStatsEmbed(self.portalData, season_df)
+        if self.aggregateData is None or self.season is None:
+          # First open: acknowledge now, the fetch may take a moment
+          await interaction.response.defer()
+          await self.load_aggregate()
+
+        if self.season is None:
+          # Season not resolved yet, keep the button so it can be retried
+          await interaction.followup.send(SEASON_UNAVAILABLE_MESSAGE, ephemeral = True)
+          return
+
+        if self.aggregateData is None:
+          # Fetch failed, keep the button so it can be retried
+          await interaction.followup.send(f"Could not load S{self.season} stats for {self.name}.", ephemeral = True)
+          return
 
-        await interaction.response.edit_message(embed = embed, attachments = [file], view = self)
+        if not self.has_current_season():
+          self.remove_item(button)
+          if interaction.response.is_done():
+            await interaction.edit_original_response(view = self)
+          else:
+            await interaction.response.edit_message(view = self)
+          await interaction.followup.send(f"{self.name} has no S{self.season} stats.", ephemeral = True)
+          return
+
+        self.select(button)
+        season_df = self.aggregateData[self.aggregateData["season"] == self.season]
+        await self.show(interaction, season_df)
 
     @button(label="Career Totals", style=ButtonStyle.success)
     async def career_totals(self, interaction: discord.Interaction, button):
-        for child in self.children:
-          child.disabled = False
-        button.disabled = True
-        
-        embed, file = self.cog.playerStatsEmbed(self.portalData, self.careerData)
-        
-        await interaction.response.edit_message(embed = embed, attachments = [file], view = self)
+        # Acknowledge first, every path below may answer with a followup
+        await interaction.response.defer()
+        if self.careerData is None:
+          await self.load_career()
+
+        if self.careerData is None or self.careerData.empty:
+          await interaction.followup.send(f"Could not load career totals for {self.name}.", ephemeral = True)
+          return
+
+        self.select(button)
+        await self.show(interaction, self.careerData)
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from utils import MILESTONES
+from table_schema import exact_values
+
+#### RECORD INDEX ####
+## Record holders and the players close behind them, for every milestone
+## stat and every league/club split of a career table, computed once per
+## table load.
+RECORD_CHASER_RATIO = 0.90
+
+
+@dataclass(frozen = True)
+class RecordEntry:
+    value: float
+    holders: list   # [(name, pid)] sharing the record, in table order
+    chasers: list   # [(name, pid, value)] within 10% of the record, highest first
+
+
+class RecordIndex:
+    """Records keyed by (stat, league, club); None means not filtered.
+
+    Split per league and club only as the table was requested (by_league,
+    by_club).
+
+    Only the rows within RECORD_CHASER_RATIO of each record are kept,
+    selected with a mask and then sorted, instead of sorting whole tables.
+    Chasers are stored for every player and filtered by active pid on
+    lookup.
+    """
+
+    def __init__(self, data, by_league = False, by_club = None):
+        self._entries = {}
+
+        stats = [stat for stat in MILESTONES if stat in data.columns]
+        names = data['name'].to_numpy()
+        pids = data['pid'].to_numpy()
+
+        groups = [
+            item for grouping in self._groupings(data, by_league, by_club) for item in grouping.items()
+        ]
+
+        for stat in stats:
+            column = exact_values(data[stat])
+            for group, positions in groups:
+                entry = self._build(column, positions, names, pids)
+                if entry is not None:
+                    self._entries[(stat, *group)] = entry
+
+    @staticmethod
+    def _groupings(data, by_league, by_club):
+        # Every (league, club) filter a lookup on this table can ask for, as
+        # row positions. Only the splits the table was requested with count.
+        columns = [
+            c for c, requested in (('league', by_league), ('club', by_club))
+            if requested and c in data.columns
+        ]
+        everything = np.arange(len(data))
+
+        splits = [(None, None)]
+        if 'league' in columns:
+            splits.append(('league', None))
+        if 'club' in columns:
+            splits.append((None, 'club'))
+        if len(columns) == 2:
+            splits.append(('league', 'club'))
+
+        for league_col, club_col in splits:
+            keys = [c for c in (league_col, club_col) if c is not None]
+            if not keys:
+                yield {(None, None): everything}
+                continue
+
+            groups = {}
+            for key, positions in data.groupby(keys, sort = False, observed = True).indices.items():
+                key = key if isinstance(key, tuple) else (key,)
+                values = iter(key)
+                league = next(values) if league_col else None
+                club = next(values) if club_col else None
+                groups[(league, club)] = positions
+            yield groups
+
+    @staticmethod
+    def _build(column, positions, names, pids):
+        values = column[positions]
+        numeric = values.astype(float)
+        if len(numeric) == 0 or np.isnan(numeric).all():
+            return None
+
+        record = np.nanmax(numeric)
+        holders = positions[numeric == record]
+
+        close = (numeric > RECORD_CHASER_RATIO*record) & (numeric < record)
+        chasers = positions[close]
+        # Highest first; ties keep table order
+        chasers = chasers[np.argsort(-column[chasers].astype(float), kind = "stable")]
+
+        return RecordEntry(
+            # NumPy scalar, so a float32 record prints as stored
+            value = column[holders[0]],
+            holders = list(zip(names[holders].tolist(), pids[holders].tolist())),
+            chasers = list(zip(names[chasers].tolist(), pids[chasers].tolist(), column[chasers])),
+        )
+
+    def record(self, stat, league = None, club = None):
+        """RecordEntry for stat among the rows matching league and club, or None."""
+        return self._entries.get((stat, league, club))
+
+    def chasers(self, stat, league = None, club = None, active_pids = None):
+        """(name, pid, value) of players within 10% of the record, highest first.
+
+        :param active_pids: if given, only players whose pid is in it
+        """
+        entry = self.record(stat, league, club)
+        if entry is None:
+            return []
+        if active_pids is None:
+            return entry.chasers
+        return [c for c in entry.chasers if c[1] in active_pids]
@@ -0,0 +1,216 @@
+import os
+import sys
+import json
+import asyncio
+import hashlib
+import logging
+import functools
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv(".secrets/.env")
+
+logger = logging.getLogger(__name__)
+
+#### RENDERED IMAGE CACHE ####
+## Rendered PNG bytes keyed by a hash of the render function and its input
+## data, so identical standings tables or final scores are only drawn once.
+## Entries are evicted least recently used once max_bytes is reached; when a
+## spill directory is set, evicted entries are kept on disk instead.
+RENDER_CACHE_BYTES = int(os.getenv("SSL_RENDER_CACHE_BYTES", 32 * 1024 * 1024))
+RENDER_CACHE_DIR = os.getenv("SSL_RENDER_CACHE_DIR") or None
+RENDER_CACHE_DISK_BYTES = int(os.getenv("SSL_RENDER_CACHE_DISK_BYTES", 256 * 1024 * 1024))
+## Part of every key. The renderer module's source is hashed in as well;
+## bump this when drawing code outside that module (gradients, assets,
+## fonts, graphics) changes, so spilled images from before are not served.
+RENDER_CACHE_VERSION = 1
+
+
+def _plain(value):
+    # NumPy scalars from DataFrame records hash like the Python values they hold
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+@functools.lru_cache(maxsize = None)
+def _module_digest(module_name):
+    # Hash of the renderer's source, so a deploy that changes it gets new keys
+    try:
+        with open(sys.modules[module_name].__file__, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (KeyError, AttributeError, TypeError, OSError):
+        return ""
+
+
+def render_key(fn, *args):
+    """Content hash of a render call: cache version, function name, the
+    source of its module and its input data.
+    """
+    payload = json.dumps(
+        [
+            RENDER_CACHE_VERSION,
+            f"{fn.__module__}.{fn.__qualname__}",
+            _module_digest(fn.__module__),
+            args,
+        ],
+        sort_keys = True,
+        default = _plain,
+        separators = (",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RenderCache:
+    def __init__(
+        self,
+        max_bytes = RENDER_CACHE_BYTES,
+        spill_dir = RENDER_CACHE_DIR,
+        max_disk_bytes = RENDER_CACHE_DISK_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()  # key -> bytes
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok = True)
+
+    def get(self, key):
+        """Cached bytes for key, or None. May read the spill directory, so
+        on the event loop use aget().
+        """
+        data = self._get_memory(key)
+        if data is not None:
+            return data
+        return self._get_spilled(key)
+
+    async def aget(self, key):
+        """get() for the event loop: disk reads run on a worker thread."""
+        data = self._get_memory(key)
+        if data is not None:
+            return data
+        if not self.spill_dir:
+            self.misses += 1
+            return None
+        return await asyncio.to_thread(self._get_spilled, key)
+
+    def put(self, key, data):
+        """Stores data. May write to the spill directory, so on the event
+        loop use aput().
+        """
+        self._spill(self._insert(key, data))
+
+    async def aput(self, key, data):
+        """put() for the event loop: spill writes run on a worker thread."""
+        evicted = self._insert(key, data)
+        if evicted and self.spill_dir:
+            await asyncio.to_thread(self._spill, evicted)
+
+    def _get_memory(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return data
+
+    def _get_spilled(self, key):
+        data = self._read_spill(key)
+        if data is not None:
+            self.disk_hits += 1
+            self.put(key, data)
+            return data
+
+        self.misses += 1
+        return None
+
+    def _insert(self, key, data):
+        # Returns the (key, data) pairs evicted from memory
+        if not data or len(data) > self.max_bytes:
+            return []
+
+        evicted = []
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = data
+            self.size += len(data)
+
+            while self.size > self.max_bytes:
+                old_key, old_data = self._entries.popitem(last = False)
+                self.size -= len(old_data)
+                self.evictions += 1
+                evicted.append((old_key, old_data))
+        return evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _spill_path(self, key):
+        return os.path.join(self.spill_dir, f"{key}.img")
+
+    def _read_spill(self, key):
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _spill(self, evicted):
+        if not self.spill_dir or not evicted:
+            return
+        try:
+            for key, data in evicted:
+                path = self._spill_path(key)
+                if not os.path.exists(path):
+                    tmp = f"{path}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, path)
+            self._trim_spill()
+        except OSError as e:
+            logger.warning(f"Could not spill rendered image to disk: {e}")
+
+    def _trim_spill(self):
+        # Oldest files go first once the spill directory is over budget
+        files = []
+        for entry in os.scandir(self.spill_dir):
+            if entry.name.endswith(".img"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+render_cache = RenderCache()
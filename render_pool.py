@@ -0,0 +1,158 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dotenv import load_dotenv
+
+from render_cache import render_cache, render_key
+
+load_dotenv(".secrets/.env")
+
+logger = logging.getLogger(__name__)
+
+#### RENDER EXECUTOR ####
+## Pillow work runs here instead of on the event loop. Render functions are
+## module level functions taking plain picklable data and returning PNG
+## bytes, so they can run in worker processes; if processes are unavailable
+## the executor falls back to threads.
+RENDER_WORKERS = int(os.getenv("SSL_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+RENDER_USE_PROCESSES = os.getenv("SSL_RENDER_PROCESSES", "1") != "0"
+RENDER_MAX_PENDING = int(os.getenv("SSL_RENDER_MAX_PENDING", 16))
+RENDER_QUEUE_TIMEOUT = float(os.getenv("SSL_RENDER_QUEUE_TIMEOUT", 30))
+
+
+class RenderQueueFull(Exception):
+    """Raised when a render waited too long for a free slot in the queue."""
+
+
+def _init_worker(logo_paths):
+    # Each worker process has its own asset cache; warm it once
+    from assets import ASSETS
+    ASSETS.preload(logo_paths)
+
+
+def _ping():
+    return os.getpid()
+
+
+class RenderExecutor:
+    def __init__(
+        self,
+        workers = RENDER_WORKERS,
+        use_processes = RENDER_USE_PROCESSES,
+        max_pending = RENDER_MAX_PENDING,
+        queue_timeout = RENDER_QUEUE_TIMEOUT,
+    ):
+        self.workers = workers
+        self.use_processes = use_processes
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.logo_paths = []
+        self._executor = None
+        self._slots = None
+        self._inflight = {}  # render key -> task, for identical concurrent renders
+
+    @property
+    def uses_processes(self):
+        return isinstance(self._executor, ProcessPoolExecutor)
+
+    def start(self, logo_paths = ()):
+        """Creates the pool. Worker processes preload logo_paths on start."""
+        self.logo_paths = list(logo_paths)
+        if self._executor is not None:
+            return
+
+        if self.use_processes:
+            try:
+                # spawn, not fork: the bot process has running threads and sockets
+                self._executor = ProcessPoolExecutor(
+                    max_workers = self.workers,
+                    mp_context = multiprocessing.get_context("spawn"),
+                    initializer = _init_worker,
+                    initargs = (self.logo_paths,),
+                )
+                return
+            except (OSError, NotImplementedError, PermissionError) as e:
+                logger.warning(f"Render process pool unavailable, using threads: {e}")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers = self.workers, thread_name_prefix = "render"
+        )
+
+    async def warm_up(self):
+        """Spins up every worker now rather than on the first command."""
+        await asyncio.gather(*(self.render(_ping) for _ in range(self.workers)))
+
+    async def render(self, fn, *args):
+        """Runs fn(*args) on the pool and returns its result.
+
+        At most max_pending renders are queued or running at once; further
+        callers wait for a slot (backpressure) and give up with
+        RenderQueueFull after queue_timeout seconds.
+        """
+        if self._executor is None:
+            self.start()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise RenderQueueFull(f"{self.max_pending} renders already pending")
+
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                return await loop.run_in_executor(self._executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM); rebuild the pool and retry once
+                logger.warning("Render process pool broke, restarting it")
+                self._restart()
+                return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+    async def render_cached(self, fn, *args):
+        """Like render(), but returns cached bytes for identical input data.
+
+        Concurrent calls with the same input share a single render. Only
+        non-empty results are cached, so a failed render is retried.
+        """
+        key = render_key(fn, *args)
+        data = await render_cache.aget(key)
+        if data is not None:
+            return data
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render_and_cache(key, fn, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_render(key, t))
+        return await asyncio.shield(task)
+
+    async def _render_and_cache(self, key, fn, *args):
+        data = await self.render(fn, *args)
+        await render_cache.aput(key, data)
+        return data
+
+    def _finish_render(self, key, task):
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved even if every waiter went away
+
+    def _restart(self):
+        old = self._executor
+        self._executor = None
+        if old is not None:
+            old.shutdown(wait = False, cancel_futures = True)
+        self.start(self.logo_paths)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait = True, cancel_futures = True)
+            self._executor = None
+
+
+render_executor = RenderExecutor()
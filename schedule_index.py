@@ -0,0 +1,116 @@
+import bisect
+import datetime
+
+#### SCHEDULE INDEX ####
+## Season schedules are indexed once per load so match lookups do not scan
+## and sort the full season on every command.
+DATE_FORMAT_STR = "%Y-%m-%d"
+
+
+def parse_date(date_str):
+    try:
+        return datetime.datetime.strptime(date_str, DATE_FORMAT_STR).date()
+    except Exception:
+        return None
+
+
+def match_key(match):
+    return (
+        match.get("MatchType"),
+        str(match.get("MatchDay")),
+        match.get("Home"),
+        match.get("Away"),
+    )
+
+
+class ScheduleIndex:
+    """Lookups over one season's schedule.
+
+    Per team, played matches are kept sorted by date so the most recent
+    one is the last entry, and unplayed matches so the next one is the
+    first entry. Matches are also grouped by (MatchType, matchday).
+    Ties on the same date keep the order of the API response.
+    """
+
+    def __init__(self, matches = None):
+        self._source = None
+        self._matches = {}   # key -> match
+        self._order = {}     # key -> position it was first seen at
+        self._played = {}    # team -> sorted [(date, -order, key)]
+        self._upcoming = {}  # team -> sorted [(date, order, key)]
+        self._by_matchday = {}  # (MatchType, matchday lower) -> sorted [(order, key)]
+        if matches is not None:
+            self.update(matches)
+
+    def __len__(self):
+        return len(self._matches)
+
+    def update(self, matches):
+        """Brings the index in line with a fresh schedule payload.
+
+        Only matches that were added, changed (e.g. a result came in) or
+        removed are touched. Passing the same payload object again is free.
+        """
+        if matches is self._source:
+            return
+        self._source = matches
+
+        seen = set()
+        for match in matches:
+            key = match_key(match)
+            seen.add(key)
+            current = self._matches.get(key)
+            if current == match:
+                continue
+            if current is not None:
+                self._remove(key)
+            self._add(key, match)
+
+        for key in [k for k in self._matches if k not in seen]:
+            self._remove(key)
+
+    def last_played(self, team):
+        """Most recent match of a team that has a result, or None."""
+        entries = self._played.get(team)
+        return self._matches[entries[-1][2]] if entries else None
+
+    def next_unplayed(self, team):
+        """Earliest dated match of a team that has no result yet, or None."""
+        entries = self._upcoming.get(team)
+        return self._matches[entries[0][2]] if entries else None
+
+    def matchday(self, match_type, matchday, team = None):
+        """Matches of one matchday of a competition, in schedule order."""
+        entries = self._by_matchday.get((match_type, str(matchday).lower()), [])
+        matches = [self._matches[key] for _, key in entries]
+        if team is not None:
+            matches = [m for m in matches if team in (m.get("Home"), m.get("Away"))]
+        return matches
+
+    def _entries_for(self, key, match):
+        order = self._order[key]
+        date = parse_date(match.get("IRLDate")) or datetime.date.min
+        teams = {match.get("Home"), match.get("Away")}
+
+        if match.get("HomeScore") is not None:
+            yield from ((self._played, team, (date, -order, key)) for team in teams)
+        elif match.get("IRLDate"):
+            yield from ((self._upcoming, team, (date, order, key)) for team in teams)
+
+        matchday_key = (match.get("MatchType"), str(match.get("MatchDay")).lower())
+        yield (self._by_matchday, matchday_key, (order, key))
+
+    def _add(self, key, match):
+        self._order.setdefault(key, len(self._order))
+        self._matches[key] = match
+        for table, group, entry in self._entries_for(key, match):
+            bisect.insort(table.setdefault(group, []), entry)
+
+    def _remove(self, key):
+        match = self._matches[key]
+        for table, group, entry in self._entries_for(key, match):
+            entries = table[group]
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                entries.pop(i)
+        del self._matches[key]
@@ -0,0 +1,104 @@
+import os
+import json
+import asyncio
+from dotenv import load_dotenv
+
+from api_client import get_client
+
+load_dotenv(".secrets/.env")
+
+#### CURRENT SEASON PROVIDER ####
+## Resolves the current season in the background instead of at import time.
+## The last known value is kept on disk so a restart while the API is down
+## still knows which season it is.
+CURRENTSEASONAPIURL = "https://api.simulationsoccer.com/admin/getCurrentSeason"
+SEASON_FILE_PATH = os.getenv("SSL_SEASON_FILE", "database/currentSeason.json")
+SEASON_REFRESH_SECONDS = int(os.getenv("SSL_SEASON_REFRESH", 3600))
+SEASON_RETRY_SECONDS = 30
+
+SEASON_UNAVAILABLE_MESSAGE = "The current season could not be loaded yet. Please try again in a moment."
+
+
+class SeasonProvider:
+    def __init__(self, path = SEASON_FILE_PATH, refresh_seconds = SEASON_REFRESH_SECONDS):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self._season = self._load()
+        self._resolved = asyncio.Event()
+        self._task = None
+
+    @property
+    def current(self):
+        """Last known current season, or None if it was never resolved."""
+        return self._season
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return int(json.load(f)["season"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        fallback = os.getenv("SSL_CURRENT_SEASON")
+        return int(fallback) if fallback else None
+
+    def _save(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok = True)
+            with open(self.path, "w") as f:
+                json.dump({"season": self._season}, f)
+        except OSError as e:
+            print("Could not persist current season:", e)
+
+    async def refresh(self, client = None):
+        """Fetches the current season from the API and persists it."""
+        data = await (client or get_client()).get_json(CURRENTSEASONAPIURL)
+        row = data[0] if isinstance(data, list) else data
+        season = int(row["season"])
+
+        if season != self._season:
+            self._season = season
+            self._save()
+        self._resolved.set()
+        return season
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+                delay = self.refresh_seconds
+            except Exception as e:
+                print("Current season refresh failed:", e)
+                delay = SEASON_RETRY_SECONDS
+            await asyncio.sleep(delay)
+
+    def start(self):
+        """Starts the periodic background refresh."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def get(self, timeout = 5):
+        """Returns the current season, waiting briefly if none is known yet."""
+        if self._season is None:
+            try:
+                await asyncio.wait_for(self._resolved.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._season
+
+
+season_provider = SeasonProvider()
+
+def current_season():
+    return season_provider.current
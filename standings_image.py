@@ -0,0 +1,556 @@
+from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import io
+import os
+import functools
+from dotenv import load_dotenv
+
+from utils import (
+    DEFAULT_FONT_PATH,
+    get_team_logo_path,
+    MAJOR_LEAGUE_LOGO_PATH,
+    MINOR_LEAGUE_LOGO_PATH,
+    MAJORS_DIV1_LOGO_PATH,
+    MINORS_DIV1_LOGO_PATH,
+    MAJORS_DIV2_LOGO_PATH,
+    MINORS_DIV2_LOGO_PATH,
+)
+from gradients import linear_gradient, VERTICAL
+from assets import ASSETS, get_image, get_font
+
+load_dotenv(".secrets/.env")
+
+#### STANDINGS IMAGES ####
+## Plain functions over plain data (standings rows as a list of dicts) so
+## they can run in a render worker process. The draw_* functions return
+## in-memory images; the create_* functions encode them exactly once.
+
+## Output encoding. Large tables encode noticeably faster with a lower PNG
+## compress level, or as WebP.
+STANDINGS_IMAGE_FORMAT = os.getenv("SSL_STANDINGS_IMAGE_FORMAT", "png").lower()
+PNG_COMPRESS_LEVEL = int(os.getenv("SSL_PNG_COMPRESS_LEVEL", 6))
+WEBP_QUALITY = int(os.getenv("SSL_WEBP_QUALITY", 90))
+WEBP_LOSSLESS = os.getenv("SSL_WEBP_LOSSLESS", "1") != "0"
+WEBP_METHOD = int(os.getenv("SSL_WEBP_METHOD", 0))  # 0 = fastest, 6 = smallest
+
+
+def standings_filename(image_format = STANDINGS_IMAGE_FORMAT):
+    return f"standings.{'webp' if image_format == 'webp' else 'png'}"
+
+
+def encode_image(image, image_format = STANDINGS_IMAGE_FORMAT):
+    buf = io.BytesIO()
+    if image_format == "webp":
+        image.save(buf, format="WEBP", lossless=WEBP_LOSSLESS, quality=WEBP_QUALITY, method=WEBP_METHOD)
+    else:
+        image.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buf.getvalue()
+
+def get_league_logo_path(league_name: str):
+    # Returns the correct logo path based on league + division
+    lname = league_name.lower()
+
+    is_major = lname.startswith("major")
+    is_div1 = "division 1" in lname
+    is_div2 = "division 2" in lname
+
+    if is_major:
+        if is_div1:
+            return MAJORS_DIV1_LOGO_PATH
+        if is_div2:
+            return MAJORS_DIV2_LOGO_PATH
+        return MAJOR_LEAGUE_LOGO_PATH
+    else:
+        if is_div1:
+            return MINORS_DIV1_LOGO_PATH
+        if is_div2:
+            return MINORS_DIV2_LOGO_PATH
+        return MINOR_LEAGUE_LOGO_PATH
+
+
+# ---------- SIDE LABEL ----------
+SIDE_LABEL_MIN_SIZE = 16
+SIDE_LABEL_MAX_SIZE = 110
+SIDE_LABEL_FALLBACK_SIZE = 20
+
+
+def side_label_color(accent_color):
+    darker_accent = tuple(max(0, int(c * 0.6)) for c in accent_color)
+    return (*darker_accent, int(255 * 0.4))
+
+
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+
+@functools.lru_cache(maxsize = 256)
+def _label_size(text, size):
+    # (width, height) of text's bounding box at a font size
+    font = get_font(DEFAULT_FONT_PATH, size)
+    bbox = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+@functools.lru_cache(maxsize = 32)
+def fit_side_label(text, available_height, color):
+    """Returns text rotated to run top to bottom, in the largest font size
+    whose rotated height fits available_height.
+
+    Sizes are binary searched over cached text metrics; the rotated
+    height is the text width. The result is shared: paste it, do not
+    draw on it.
+    """
+    low, high = SIDE_LABEL_MIN_SIZE, SIDE_LABEL_MAX_SIZE
+    best = None
+    while low <= high:
+        size = (low + high) // 2
+        if _label_size(text, size)[0] <= available_height:
+            best = size
+            low = size + 1
+        else:
+            high = size - 1
+
+    size = best if best is not None else SIDE_LABEL_FALLBACK_SIZE
+    width, height = _label_size(text, size)
+    label = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    ImageDraw.Draw(label).text(
+        (0, 0), text, font=get_font(DEFAULT_FONT_PATH, size), fill=color,
+    )
+    return label.rotate(-90, expand=True)
+
+
+# ---------- IMAGE GENERATION: SINGLE TABLE ----------
+def create_standings_image(
+    standings_data,
+    league_name,
+    season,
+    show_header=False,
+    show_trophy=True,
+    table_only=False,
+    show_side_label=True,
+    image_format=STANDINGS_IMAGE_FORMAT,
+):
+    image = draw_standings_image(
+        standings_data, league_name, season, show_header, show_trophy, table_only, show_side_label,
+    )
+    return encode_image(image, image_format) if image is not None else None
+
+
+def draw_standings_image(
+    standings_data,
+    league_name,
+    season,
+    show_header=False,
+    show_trophy=True,
+    table_only=False,
+    show_side_label=True,
+):
+    try:
+        # Theme and assets
+        is_major = league_name.lower().startswith("major")
+        accent_color = (218, 185, 45) if is_major else (176, 40, 49)
+        bg_dark = (30, 30, 30)
+        gradient_end = (46, 46, 46)
+        header_bg = (48, 48, 48)
+        row_even = (38, 38, 38)
+        row_odd = (26, 26, 26, 255)
+        top_row = (
+            int(accent_color[0] * 0.85),
+            int(accent_color[1] * 0.85),
+            int(accent_color[2] * 0.85),
+            120,
+        )
+        # Promotion / relegation colors (S24+ only)
+        promotion_green = (39, 174, 96, 120)   # Clean green
+        playoff_blue = (41, 128, 185, 120)      # Clear blue
+        relegation_red = (169, 50, 38, 120)     # Distinct from Minors red
+
+        league_logo_path = get_league_logo_path(league_name)
+
+        # Fonts
+        try:
+            title_font = get_font(DEFAULT_FONT_PATH, 52)
+            header_font = get_font(DEFAULT_FONT_PATH, 28)
+            row_font = get_font(DEFAULT_FONT_PATH, 22)
+        except Exception:
+            title_font = ImageFont.load_default()
+            header_font = ImageFont.load_default()
+            row_font = ImageFont.load_default()
+
+        logo_size = 48
+        row_height = 64
+        padding = 12
+
+        columns = [
+            ("#", 40, "center", None),
+            ("Team", 330, "left", "Team"),
+            ("P", 50, "center", "MatchesPlayed"),
+            ("W", 50, "center", "Wins"),
+            ("D", 50, "center", "Draws"),
+            ("L", 50, "center", "Losses"),
+            ("GF", 50, "center", "GoalsFor"),
+            ("GA", 50, "center", "GoalsAgainst"),
+            ("GD", 52, "center", "GoalDifference"),
+            ("Pts", 54, "center", "Points"),
+        ]
+
+        col_widths = {col[0]: col[1] for col in columns}
+        total_width = sum(w for _, w, _, _ in columns) + padding * 2
+        num_rows = len(standings_data)
+        # Division detection
+        is_division_1 = "division 1" in league_name.lower()
+        is_division_2 = "division 2" in league_name.lower()
+        total_height = 100 + (row_height * (num_rows + 1)) + padding * 2
+
+        canvas_width = total_width if table_only else total_width + 260
+        if table_only:
+            image = Image.new(
+                "RGBA", (canvas_width, total_height + 40), bg_dark
+            )
+        else:
+            # Gradient background
+            image = linear_gradient(
+                (canvas_width, total_height + 40), accent_color, gradient_end, VERTICAL
+            )
+        draw = ImageDraw.Draw(image)
+
+        # Trophy + vertical label
+        if show_trophy and not table_only:
+            trophy_panel_x = total_width + 40
+            trophy_panel_y = total_height - 360
+            trophy_panel_w, trophy_panel_h = 200, 340
+
+            try:
+                tr_w, tr_h = ASSETS.source_size(league_logo_path)
+                scale = min(trophy_panel_w / tr_w, trophy_panel_h / tr_h)
+                new_w, new_h = int(tr_w * scale), int(tr_h * scale)
+                trophy = get_image(
+                    league_logo_path, (new_w, new_h), resample=Image.Resampling.LANCZOS
+                )
+
+                center_x = trophy_panel_x + (trophy_panel_w - new_w) // 2
+                center_y = trophy_panel_y + (trophy_panel_h - new_h) // 2
+
+                # Shadow from trophy shape
+                shadow = Image.new("RGBA", trophy.size, (0, 0, 0, 0))
+                shadow_mask = trophy.split()[3]
+                shadow.paste((0, 0, 0, 180), mask=shadow_mask)
+                shadow = shadow.filter(ImageFilter.GaussianBlur(radius=6))
+                sx = center_x + 8
+                sy = center_y + 8
+                image.paste(shadow, (sx, sy), shadow)
+
+                image.paste(trophy, (center_x, center_y), trophy)
+
+                # Vertical MAJORS/MINORS label, sized to the space above the trophy
+                if show_side_label:
+                    side_label = "MAJORS" if is_major else "MINORS"
+                    label_top_limit = 20
+                    label_bottom_limit = center_y - 10
+                    available_height = max(60, label_bottom_limit - label_top_limit)
+
+                    label_img = fit_side_label(side_label, available_height, side_label_color(accent_color))
+                    lx = trophy_panel_x + (trophy_panel_w - label_img.width) // 2
+                    ly = label_bottom_limit - label_img.height
+                    if ly < 10:
+                        ly = 10
+                    image.paste(label_img, (lx, ly), label_img)
+
+            except Exception as e:
+                print(f"Error loading trophy or drawing side label: {e}")
+
+        # Header row
+        header_y = 80
+        draw.rectangle(
+            [padding, header_y, total_width + padding, header_y + row_height],
+            fill=header_bg,
+            outline=None,
+        )
+        x = padding
+        for header, _, align, _ in columns:
+            text = header
+            hbbox = draw.textbbox((0, 0), text, font=header_font)
+            w, h = hbbox[2] - hbbox[0], hbbox[3] - hbbox[1]
+            if align == "center":
+                tx = x + (col_widths[header] - w) // 2
+            elif align == "right":
+                tx = x + col_widths[header] - w - 12
+            else:
+                tx = x + 12
+            draw.text(
+                (tx, header_y + (row_height - h) // 2),
+                text,
+                font=header_font,
+                fill="white",
+            )
+            x += col_widths[header]
+
+        # Team rows
+        current_y = header_y + row_height
+        for position, team_stats in enumerate(standings_data, start=1):
+            x = padding
+            #Default row background
+            row_bg = top_row if position == 1 else (
+                row_even if position % 2 == 0 else row_odd
+            )
+            # Promotion / Relegation logic (S24+ only)              
+            if season >= 24:
+            # Division 2 rules    
+                if is_division_2:
+                    if position == 1:
+                        row_bg = promotion_green
+                    elif position == 2:
+                        row_bg = playoff_blue
+            # Division 1 rules
+                if is_division_1:
+                    if position == num_rows:
+                        row_bg = relegation_red
+                    elif position == num_rows - 1:
+                        row_bg = playoff_blue
+            draw.rectangle(
+                [padding, current_y, total_width + padding, current_y + row_height],
+                fill=row_bg,
+                outline=None,
+            )
+
+            # Rank
+            pos_text = str(position)
+            pbbox = draw.textbbox((0, 0), pos_text, font=row_font)
+            w, h = pbbox[2] - pbbox[0], pbbox[3] - pbbox[1]
+            draw.text(
+                (x + (col_widths["#"] - w) // 2, current_y + (row_height - h) // 2),
+                pos_text,
+                font=row_font,
+                fill="white",
+            )
+            x += col_widths["#"]
+
+            # Logo + Name
+            team_name = team_stats["team"]
+            try:
+                logo_path = get_team_logo_path(team_name)
+                logo = get_image(
+                    logo_path, (logo_size, logo_size), resample=Image.Resampling.LANCZOS
+                )
+                logo_y = current_y + (row_height - logo_size) // 2
+                image.paste(logo, (x + 12, logo_y), logo)
+            except Exception:
+                pass
+
+            tn_x = x + logo_size + 24
+            nbbox = draw.textbbox((0, 0), team_name, font=row_font)
+            w, h = nbbox[2] - nbbox[0], nbbox[3] - nbbox[1]
+            draw.text(
+                (tn_x, current_y + (row_height - h) // 2),
+                team_name,
+                font=row_font,
+                fill="white",
+            )
+            x += col_widths["Team"]
+
+            # Stats
+            data_keys = [
+                "mp",
+                "w",
+                "d",
+                "l",
+                "gf",
+                "ga",
+                "gd",
+                "p",
+            ]
+            for idx_col, header in enumerate([col[0] for col in columns[2:]]):
+                value = str(team_stats[data_keys[idx_col]])
+                vbbox = draw.textbbox((0, 0), value, font=row_font)
+                w, h = vbbox[2] - vbbox[0], vbbox[3] - vbbox[1]
+                col = columns[2 + idx_col]
+                align = col[2]
+                if align == "center":
+                    tx = x + (col_widths[header] - w) // 2
+                elif align == "right":
+                    tx = x + col_widths[header] - w - 10
+                else:
+                    tx = x + 10
+                draw.text(
+                    (tx, current_y + (row_height - h) // 2),
+                    value,
+                    font=row_font,
+                    fill="white",
+                )
+                x += col_widths[header]
+            current_y += row_height
+
+        draw.line(
+            [(padding, header_y + row_height), (total_width + padding, header_y + row_height)],
+            fill=accent_color,
+            width=3,
+        )
+
+        return image
+    except Exception as e:
+        print(
+            f"Error creating standings image for {league_name} Season {season}: {e}"
+        )
+        return None
+
+
+# ---------- IMAGE GENERATION: TWO DIVISIONS ----------
+def create_two_divisions_image(
+    standings_div1,
+    standings_div2,
+    league_name,
+    season,
+    image_format=STANDINGS_IMAGE_FORMAT,
+):
+    combined = draw_two_divisions_image(standings_div1, standings_div2, league_name, season)
+    return encode_image(combined, image_format) if combined is not None else None
+
+
+def draw_two_divisions_image(
+    standings_div1,
+    standings_div2,
+    league_name,
+    season,
+):
+    # Generate bare tables (no header/logo inside each, no trophy panel)
+    img1 = draw_standings_image(
+        standings_div1, f"{league_name} Division 1", season, show_header=False, show_trophy=False, table_only=True, show_side_label=False,
+    )
+    img2 = draw_standings_image(
+        standings_div2, f"{league_name} Division 2", season, show_header=False, show_trophy=False, table_only=True, show_side_label=False,
+    )
+    if img1 is None or img2 is None:
+        return None
+
+    # Theme for combined image
+    is_major = league_name.lower().startswith("major")
+    accent_color = (218, 185, 45) if is_major else (176, 40, 49)
+    bg_dark = (30, 30, 30)
+    gradient_end = (46, 46, 46)
+    league_logo_path = (
+        MAJOR_LEAGUE_LOGO_PATH
+        if league_name.lower().startswith("major")
+        else MINOR_LEAGUE_LOGO_PATH
+    )
+
+
+    # Fonts
+    try:
+        title_font = get_font(DEFAULT_FONT_PATH, 52)
+        header_font = get_font(DEFAULT_FONT_PATH, 28)
+        row_font = get_font(DEFAULT_FONT_PATH, 22)
+        division_font = get_font(DEFAULT_FONT_PATH, 32)
+    except Exception:
+        title_font = ImageFont.load_default()
+        header_font = ImageFont.load_default()
+        row_font = ImageFont.load_default()
+        division_font = ImageFont.load_default()
+
+    LEFT_MARGIN = 20    
+
+    # Table dimensions (match single table)
+    logo_size = 48
+    row_height = 64
+    padding = 12
+    columns = [
+        ("#", 40, "center", None),
+        ("Team", 330, "left", "Team"),
+        ("P", 50, "center", "MatchesPlayed"),
+        ("W", 50, "center", "Wins"),
+        ("D", 50, "center", "Draws"),
+        ("L", 50, "center", "Losses"),
+        ("GF", 50, "center", "GoalsFor"),
+        ("GA", 50, "center", "GoalsAgainst"),
+        ("GD", 52, "center", "GoalDifference"),
+        ("Pts", 54, "center", "Points"),
+    ]
+    col_widths = {col[0]: col[1] for col in columns}
+    total_width = sum(w for _, w, _, _ in columns) + padding * 2
+
+    # Height reserved for the single global title
+    header_height = 30
+    width = total_width + 260  # Match single table width (table + trophy panel)
+    height = header_height + img1.height + img2.height + 100
+
+    # Gradient background
+    combined = linear_gradient((width, height), accent_color, gradient_end, VERTICAL)
+    draw = ImageDraw.Draw(combined)
+
+
+    # Paste the two division tables below the header (aligned left)
+    # --- Division 1 label ---
+    d1_text = "Division 1"
+    bbox = draw.textbbox((0, 0), d1_text, font=division_font)
+    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    d1_y = header_height
+    draw.text(
+        (LEFT_MARGIN + (total_width - tw) // 2, d1_y),
+        d1_text,
+        font=division_font,
+        fill="white",
+    )   
+    # Paste Division 1 table
+    combined.paste(img1, (LEFT_MARGIN, d1_y + th + 10), img1)
+
+    # --- Division 2 label ---
+    d2_text = "Division 2"
+    bbox = draw.textbbox((0, 0), d2_text, font=division_font)
+    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    d2_y = d1_y + th + 10 + img1.height + 20
+    draw.text(
+        (LEFT_MARGIN + (total_width - tw) // 2, d2_y),
+        d2_text,
+        font=division_font,
+        fill="white",
+    )
+    # Paste Division 2 table
+    combined.paste(img2, (LEFT_MARGIN, d2_y + th + 10), img2)
+
+
+    # Single trophy + vertical label positioned relative to combined tables
+    # trophy_panel_x and trophy_panel_y match single table positioning logic
+    trophy_panel_x = total_width + 40
+    combined_table_height = img1.height + img2.height
+    trophy_panel_y = header_height + combined_table_height - 360
+    trophy_panel_w, trophy_panel_h = 200, 340
+
+    try:
+        tr_w, tr_h = ASSETS.source_size(league_logo_path)
+        scale = min(trophy_panel_w / tr_w, trophy_panel_h / tr_h)
+        new_w, new_h = int(tr_w * scale), int(tr_h * scale)
+        trophy = get_image(
+            league_logo_path, (new_w, new_h), resample=Image.Resampling.LANCZOS
+        )
+
+        center_x = trophy_panel_x + (trophy_panel_w - new_w) // 2
+        center_y = trophy_panel_y + (trophy_panel_h - new_h) // 2
+
+        # Shadow from trophy shape
+        shadow = Image.new("RGBA", trophy.size, (0, 0, 0, 0))
+        shadow_mask = trophy.split()[3]
+        shadow.paste((0, 0, 0, 180), mask=shadow_mask)
+        shadow = shadow.filter(ImageFilter.GaussianBlur(radius=6))
+        sx = center_x + 8
+        sy = center_y + 8
+        combined.paste(shadow, (sx, sy), shadow)
+
+        combined.paste(trophy, (center_x, center_y), trophy)
+
+        # Vertical MAJORS/MINORS label (same logic as single table)
+        side_label = "MAJORS" if is_major else "MINORS"
+
+        label_top_limit = 20 + header_height  # Offset for header
+        label_bottom_limit = center_y - 10
+        available_height = max(60, label_bottom_limit - label_top_limit)
+
+        label_img = fit_side_label(side_label, available_height, side_label_color(accent_color))
+        lx = trophy_panel_x + (trophy_panel_w - label_img.width) // 2
+        ly = label_bottom_limit - label_img.height
+        if ly < label_top_limit:
+            ly = label_top_limit
+        combined.paste(label_img, (lx, ly), label_img)
+
+    except Exception as e:
+        print(f"Error loading trophy or drawing side label: {e}")
+
+    return combined
@@ -0,0 +1,116 @@
+import logging
+import numpy as np
+import pandas as pd
+
+from utils import MILESTONES, OUT_STAT_GROUPS, GK_STAT_GROUPS
+
+logger = logging.getLogger(__name__)
+
+#### TABLE SCHEMAS ####
+## API tables arrive with every column as generic dtypes. A schema keeps
+## only the columns the bot reads and stores them compactly: repeated
+## strings as categoricals, integers as int32 and floats as float32.
+
+INT32_MIN, INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+
+def _unique(*groups):
+    columns = []
+    for group in groups:
+        for column in group:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def compact_numeric(column, compact_floats = True):
+    """Returns an integer column as int32 (if it fits) and a float column as
+    float32, or float64 if compact_floats is False. Columns that are not
+    numeric are returned as is.
+    """
+    if not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+        try:
+            column = pd.to_numeric(column)
+        except (ValueError, TypeError):
+            return column
+        if not pd.api.types.is_numeric_dtype(column):
+            return column
+
+    if pd.api.types.is_integer_dtype(column):
+        if len(column) and (column.min() < INT32_MIN or column.max() > INT32_MAX):
+            return column
+        return column.astype(np.int32)
+    return column.astype(np.float32 if compact_floats else np.float64)
+
+
+def exact_values(column):
+    """Returns column as a NumPy array for arithmetic and display.
+
+    float32 values are widened through their shortest decimal form, so
+    2499.2 comes back as 2499.2 and not 2499.199951171875.
+    """
+    values = column.to_numpy()
+    if values.dtype == np.float32:
+        return values.astype(str).astype(np.float64)
+    return values
+
+
+def memory_bytes(data):
+    return int(data.memory_usage(deep = True).sum())
+
+
+class TableSchema:
+    def __init__(self, name, categories = (), numeric = (), keep = (), compact_floats = True):
+        """
+        :param name: dataset name used in memory reports
+        :param categories: string columns stored as categoricals
+        :param numeric: columns stored as int32/float32
+        :param keep: columns kept unchanged
+        :param compact_floats: False keeps floats as float64, for tables
+            whose values are printed directly
+        """
+        self.name = name
+        self.categories = list(categories)
+        self.numeric = list(numeric)
+        self.keep = list(keep)
+        self.compact_floats = compact_floats
+        self.columns = _unique(self.keep, self.categories, self.numeric)
+
+    def apply(self, data):
+        """Returns a compact copy of data with only the schema's columns.
+
+        Missing columns are skipped. The memory footprint before and after
+        is logged at debug level.
+        """
+        before = memory_bytes(data)
+        table = data[[c for c in self.columns if c in data.columns]].copy()
+
+        for column in self.categories:
+            if column in table.columns:
+                table[column] = table[column].astype("category")
+        for column in self.numeric:
+            if column in table.columns:
+                table[column] = compact_numeric(table[column], self.compact_floats)
+
+        logger.debug(
+            f"{self.name}: {len(table)} rows x {len(table.columns)} columns, "
+            f"{before / 1024:.0f} KiB -> {memory_bytes(table) / 1024:.0f} KiB"
+        )
+        return table
+
+
+## Career totals of all players, read by the milestone and record indexes
+CAREER_SCHEMA = TableSchema(
+    "career",
+    categories = ["name", "league", "club"],
+    numeric = ["pid", *MILESTONES],
+)
+
+## A single player's season aggregates or career totals, read by /player.
+## The embed prints round(value, 2), which float32 values do not survive.
+PLAYER_STATS_SCHEMA = TableSchema(
+    "player stats",
+    categories = ["name", "league", "club"],
+    numeric = _unique(["pid", "season"], *OUT_STAT_GROUPS.values(), *GK_STAT_GROUPS.values()),
+    compact_floats = False,
+)
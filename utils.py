@@ -1,9 +1,8 @@
 from PIL import Image, ImageDraw, ImageFont
-import requests
-import json 
 import pandas as pd
 import os
-import aiohttp
+from api_client import get_client
+from season_provider import current_season
 # from pytablericons import TablerIcons, OutlineIcon, FilledIcon
 
 
@@ -119,9 +118,12 @@ LEAGUEIDMAP = {
 
 league_by_id = { v: k for k, v in LEAGUEIDMAP.items() }
 
-season = requests.get('https://api.simulationsoccer.com/admin/getCurrentSeason')
-
-CURRENT_SEASON = int(pd.DataFrame(json.loads(season.content))['season'].iloc[0])
+# CURRENT_SEASON is resolved in the background by season_provider; reading
+# utils.CURRENT_SEASON always returns the latest known value.
+def __getattr__(name):
+  if name == "CURRENT_SEASON":
+    return current_season()
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 DEFAULT_LOGO_PATH = "./graphics/logos/league-logo.png"  
 MAJOR_LEAGUE_LOGO_PATH = "./graphics/logos/major_league_logo.png"
@@ -154,29 +156,14 @@ MAJOR_TROPHY_PATH= "./graphics/trophies/SSL_Major_Trophy_Front.png"
 MINOR_TROPHY_PATH= "./graphics/trophies/SSL_Minor_Trophy_Front.png"
 
 async def getAPI(endpoint, params = None):
-  async with aiohttp.ClientSession() as session:
-    try:
-      async with session.get(endpoint, params=params, timeout=15) as resp:
-        if resp.status != 200:
-            print("getAPI error: HTTP", resp.status)
-            return None
-
-        data = await resp.json()
-
-        # If API returns a list, convert directly
-        if isinstance(data, list):
-            return pd.DataFrame(data)
-
-        # If API returns a dict, wrap it in a list
-        if isinstance(data, dict):
-            return pd.DataFrame([data])
-
-        print("getAPI error: unexpected JSON type", type(data))
-        return None
-
-    except Exception as e:
-      print("getAPI exception:", e)
-      return None
+  try:
+    data = await get_client().get_frame(endpoint, params = params)
+  except Exception as e:
+    print("getAPI exception:", e)
+    return None
+
+  # The cached frame is shared, callers get their own (copy-on-write) view
+  return data.copy(deep = False)
   
 async def get_team_colors_from_api():
     url = GETORGAPIURL
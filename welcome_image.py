@@ -0,0 +1,54 @@
+import functools
+import easy_pil
+from PIL import ImageFilter
+
+from utils import DEFAULT_FONT_PATH
+from assets import get_font
+
+#### WELCOME CARD ####
+## 1920x1080 member join card. Runs in a render worker process: takes the
+## background file name, the avatar as raw bytes and the member name, and
+## returns PNG bytes.
+WELCOME_IMAGE_DIR = "./graphics/welcome_images"
+
+
+@functools.lru_cache(maxsize = 8)
+def _blurred_background(filename):
+    # Resizing and blurring the wallpaper is the most expensive step and
+    # only depends on which wallpaper was picked
+    bg = easy_pil.Editor(f"{WELCOME_IMAGE_DIR}/{filename}").resize((1920, 1080))
+    return bg.image.filter(ImageFilter.GaussianBlur(radius=5))
+
+
+def create_welcome_image(background, avatar_bytes, member_name):
+    # Editor converts (and so copies) the cached background
+    bg = easy_pil.Editor(_blurred_background(background))
+
+    avatar = easy_pil.Editor(avatar_bytes).resize((250, 250)).circle_image()
+
+    font_big = get_font(DEFAULT_FONT_PATH, 135)
+    font_small = get_font(DEFAULT_FONT_PATH, 65)
+
+    bg.paste(avatar, (835, 340))
+    bg.ellipse((835, 340), 250, 250, outline="#ED9523", stroke_width=5)
+
+    x1, y1 = (960, 620) #Coordinates for the big welcome text in image
+    offsets = [(-4, 0), (4, 0), (0, -4), (0, 4)]
+
+    # Draw outline by drawing text shifted in four directions
+    for dx, dy in offsets:
+        bg.text((x1 + dx, y1 + dy), f"Greetings!", font=font_big, color="#ffffff", align="center")
+    # Draw main text on top
+    bg.text((x1, y1), f"Greetings!", font=font_big, color="#070B51", align="center")
+
+    x2, y2 = (960, 800) #Coordinates for the small member count text in image
+    offset = 5
+    offsets = [(-offset, 0), (offset, 0), (0, -offset), (0, offset)]
+
+    # Draw outline by drawing text shifted in four directions
+    for dx, dy in offsets:
+        bg.text((x2 + dx, y2 + dy),  f"{member_name} is here!", font=font_small, color="#ffffff", align="center")
+    # Draw main text on top
+    bg.text((x2, y2),  f"{member_name} is here!", font=font_small, color="#070B51", align="center")
+
+    return bg.image_bytes.getvalue()